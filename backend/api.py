@@ -4,29 +4,54 @@ FastAPI application for Creative Automation Pipeline.
 Provides REST API endpoints for campaign processing.
 """
 
+import asyncio
+import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File
+import aiofiles
+import orjson
+from arq import create_pool
+from arq.connections import RedisSettings
+from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field, ConfigDict
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 from dotenv import load_dotenv
-import shutil
 
 from src.models.campaign import CampaignBrief, Product
-from src.pipeline.orchestrator import CampaignPipeline
+from src.services.campaign_store import CampaignStore, REDIS_URL
+from src.services.static_files import CachedStaticFiles
+from src.utils.path_utils import resolve_campaign_path
 
 # Load environment variables
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  """Open the job queue and campaign store for the lifetime of the app."""
+  app.state.redis_pool = await create_pool(RedisSettings.from_dsn(REDIS_URL))
+  app.state.store = CampaignStore()
+  yield
+  SCAN_EXECUTOR.shutdown(wait=False)
+  await app.state.store.close()
+  await app.state.redis_pool.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
   title="Creative Automation Pipeline API",
   description="AI-powered creative asset generation for social campaigns",
-  version="1.0.0"
+  version="1.0.0",
+  lifespan=lifespan,
+  # Asset listings can run to thousands of entries; orjson serializes them much faster
+  default_response_class=ORJSONResponse
 )
 
 # Configure CORS for local React development
@@ -46,11 +71,22 @@ OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 UPLOADS_DIR = Path("./uploads")
 UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
 
-# In-memory storage for campaign status (POC only)
-campaign_store: Dict[str, Dict[str, Any]] = {}
+# Shared pool for blocking directory scans, so they run off the event loop
+SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="asset-scan")
+
+# Last /api/generated-images response, as (fingerprint, payload)
+_generated_images_cache: Optional[Tuple[Tuple, Dict[str, Any]]] = None
 
-# In-memory storage for campaign progress updates (POC only)
-progress_store: Dict[str, list] = {}
+# Campaign records fetched per Redis round trip when listing campaigns
+LIST_BATCH_SIZE = 100
+
+# Read/write buffer for streaming uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Serve generated assets and uploads from disk (small files cached in memory)
+ASSETS_URL_PREFIX = "/api/campaigns-static"
+app.mount(ASSETS_URL_PREFIX, CachedStaticFiles(directory=OUTPUT_DIR), name="campaign-assets")
+app.mount("/api/uploads", CachedStaticFiles(directory=UPLOADS_DIR), name="uploads")
 
 
 # Pydantic models for API
@@ -89,17 +125,182 @@ class CampaignStatus(BaseModel):
   error: Optional[str] = None
 
 
+# Validator for building Product dataclasses from ProductInput fields,
+# compiled once at import instead of per request
+_products_adapter = TypeAdapter(list[Product])
+
+
 # Helper functions
+def asset_url(path: str) -> str:
+  """Public URL for a file or directory under OUTPUT_DIR, served by the static assets mount."""
+  return f"{ASSETS_URL_PREFIX}/{Path(path).relative_to(OUTPUT_DIR).as_posix()}"
+
+
+def scandir_campaign(campaign_dir: str, campaign_id: str) -> Tuple[str, Any]:
+  """
+  Open a campaign's product listing, handling the nested directory layout.
+
+  The pipeline writes products to <campaign_dir>/<campaign_id>/. Opening that
+  directory directly and falling back on failure costs one syscall, instead of
+  probing it with exists()/is_dir() and then opening it.
+
+  Args:
+    campaign_dir: Campaign output directory
+    campaign_id: Campaign identifier
+
+  Returns:
+    Tuple of (directory containing the products, os.scandir iterator over it)
+
+  Raises:
+    FileNotFoundError: If the campaign directory does not exist
+  """
+  nested_campaign_dir = os.path.join(campaign_dir, campaign_id)
+  try:
+    return nested_campaign_dir, os.scandir(nested_campaign_dir)
+  except (FileNotFoundError, NotADirectoryError):
+    return campaign_dir, os.scandir(campaign_dir)
+
+
+def scan_campaign_assets(scan_dir: str) -> list[Dict[str, Any]]:
+  """
+  Collect the final creatives under a campaign's product directory.
+
+  Uses os.scandir so file type checks come from the directory listing
+  instead of a stat() per entry.
+
+  Args:
+    scan_dir: Directory containing one subdirectory per product
+
+  Returns:
+    Asset entries with product, language, aspect ratio, URL and filename
+
+  Raises:
+    FileNotFoundError: If the directory does not exist
+  """
+  assets = []
+
+  # Build URLs by string concatenation from entry names instead of
+  # resolving a Path per image
+  url_prefix = asset_url(scan_dir) + "/"
+
+  with os.scandir(scan_dir) as product_entries:
+    for product_entry in product_entries:
+      pname = product_entry.name
+      if not product_entry.is_dir(follow_symlinks=False) or pname == "__pycache__":
+        continue
+
+      # Check for language subdirectories
+      with os.scandir(product_entry.path) as lang_entries:
+        for lang_or_file in lang_entries:
+          lname = lang_or_file.name
+
+          # Skip hidden pre-overlay files used for compliance checking
+          if lname.startswith('.'):
+            continue
+
+          if lang_or_file.is_dir(follow_symlinks=False):
+            # Language subdirectory
+            lang_prefix = url_prefix + pname + "/" + lname + "/"
+            with os.scandir(lang_or_file.path) as image_entries:
+              for image_entry in image_entries:
+                fname = image_entry.name
+                if fname.startswith('.') or not fname.endswith(".jpg"):
+                  continue
+                assets.append({
+                  "product": pname,
+                  "language": lname,
+                  "aspect_ratio": fname[:-4],
+                  "url": lang_prefix + fname,
+                  "filename": fname
+                })
+          elif lname.endswith(".jpg"):
+            # Direct image file (no localization)
+            assets.append({
+              "product": pname,
+              "language": "en",
+              "aspect_ratio": lname[:-4],
+              "url": url_prefix + pname + "/" + lname,
+              "filename": lname
+            })
+
+  return assets
+
+
+def list_campaign_dirs() -> Tuple[list[Tuple[str, str]], Tuple]:
+  """
+  List campaign directories under OUTPUT_DIR along with a change fingerprint.
+
+  The fingerprint combines the mtimes of OUTPUT_DIR, each campaign directory
+  and its nested campaign directory. Those change when a campaign is added
+  and when the pipeline writes its report, so an unchanged fingerprint
+  means a previous scan of the source images is still valid.
+
+  Returns:
+    Tuple of ([(campaign_dir, campaign_id), ...], fingerprint)
+  """
+  campaign_dirs = []
+  mtimes = []
+
+  with os.scandir(OUTPUT_DIR) as campaign_entries:
+    for entry in campaign_entries:
+      if not entry.is_dir(follow_symlinks=False):
+        continue
+      campaign_dirs.append((entry.path, entry.name))
+
+      try:
+        nested_mtime = os.stat(os.path.join(entry.path, entry.name)).st_mtime_ns
+      except FileNotFoundError:
+        nested_mtime = 0
+      mtimes.append((entry.name, entry.stat().st_mtime_ns, nested_mtime))
+
+  fingerprint = (os.stat(OUTPUT_DIR).st_mtime_ns, tuple(sorted(mtimes)))
+  return campaign_dirs, fingerprint
+
+
+def scan_source_images(campaign_dir: str, campaign_id: str) -> list[Dict[str, Any]]:
+  """
+  Collect the source images generated for each product of one campaign.
+
+  Args:
+    campaign_dir: Campaign directory under OUTPUT_DIR
+    campaign_id: Campaign identifier (the directory name)
+
+  Returns:
+    Generated image entries for the campaign's products
+  """
+  images = []
+  scan_dir, product_entries = scandir_campaign(campaign_dir, campaign_id)
+  url_prefix = asset_url(scan_dir) + "/"
+
+  # Scan for product images
+  with product_entries:
+    for product_entry in product_entries:
+      if not product_entry.is_dir(follow_symlinks=False) or product_entry.name == "__pycache__":
+        continue
+
+      # Look for source images (DALL-E generated, before variations);
+      # a single stat both checks existence and gives the mtime
+      source_image = os.path.join(product_entry.path, "source.jpg")
+      try:
+        source_mtime = os.stat(source_image).st_mtime
+      except FileNotFoundError:
+        continue
+
+      images.append({
+        "campaign_id": campaign_id,
+        "product": product_entry.name,
+        "filename": "source.jpg",
+        "url": url_prefix + product_entry.name + "/source.jpg",
+        "absolute_path": os.path.abspath(source_image),
+        "created_at": datetime.fromtimestamp(source_mtime).isoformat()
+      })
+
+  return images
+
+
 def create_campaign_brief(campaign_id: str, input_data: CampaignInput) -> CampaignBrief:
   """Convert API input to CampaignBrief model."""
-  products = [
-    Product(
-      name=p.name,
-      description=p.description,
-      existing_assets=p.existing_assets
-    )
-    for p in input_data.products
-  ]
+  products = _products_adapter.validate_python([p.__dict__ for p in input_data.products])
 
   return CampaignBrief(
     campaign_id=campaign_id,
@@ -112,47 +313,6 @@ def create_campaign_brief(campaign_id: str, input_data: CampaignInput) -> Campai
   )
 
 
-def process_campaign_task(campaign_id: str, brief: CampaignBrief, enable_copywriting: bool):
-  """Background task to process campaign."""
-  try:
-    # Update status
-    campaign_store[campaign_id]["status"] = "processing"
-    campaign_store[campaign_id]["started_at"] = datetime.now().isoformat()
-
-    # Initialize progress tracking
-    progress_store[campaign_id] = []
-
-    # Define progress callback
-    def progress_callback(progress_data: Dict[str, Any]):
-      """Callback to capture progress updates from pipeline."""
-      progress_store[campaign_id].append(progress_data)
-      # Also update the latest progress in campaign store for quick access
-      campaign_store[campaign_id]["latest_progress"] = progress_data
-
-    # Initialize pipeline with progress callback
-    output_path = OUTPUT_DIR / campaign_id
-    pipeline = CampaignPipeline(
-      output_dir=str(output_path),
-      enable_copywriting=enable_copywriting,
-      progress_callback=progress_callback
-    )
-
-    # Process campaign
-    report = pipeline.process_campaign(brief)
-
-    # Update status with results
-    campaign_store[campaign_id]["status"] = "completed"
-    campaign_store[campaign_id]["completed_at"] = datetime.now().isoformat()
-    campaign_store[campaign_id]["report"] = report
-    campaign_store[campaign_id]["output_path"] = str(output_path)
-
-  except Exception as e:
-    # Update status with error
-    campaign_store[campaign_id]["status"] = "failed"
-    campaign_store[campaign_id]["error"] = str(e)
-    campaign_store[campaign_id]["completed_at"] = datetime.now().isoformat()
-
-
 # API Endpoints
 @app.get("/")
 async def root():
@@ -165,14 +325,11 @@ async def root():
 
 
 @app.post("/api/campaigns/process", response_model=CampaignResponse)
-async def create_campaign(
-  campaign_input: CampaignInput,
-  background_tasks: BackgroundTasks
-):
+async def create_campaign(campaign_input: CampaignInput):
   """
   Create and process a new campaign.
 
-  Returns immediately with campaign_id while processing happens in background.
+  Returns immediately with campaign_id while a queue worker processes it.
   """
   # Generate unique campaign ID
   campaign_id = f"campaign_{uuid.uuid4().hex[:8]}"
@@ -181,23 +338,23 @@ async def create_campaign(
   brief = create_campaign_brief(campaign_id, campaign_input)
 
   # Initialize campaign status
-  campaign_store[campaign_id] = {
+  await app.state.store.create(campaign_id, {
     "campaign_id": campaign_id,
     "status": "queued",
-    "created_at": datetime.now().isoformat(),
+    "created_at": time.time(),
     "brief": {
       "target_region": brief.target_region,
       "target_audience": brief.target_audience,
       "campaign_message": brief.campaign_message,
       "product_count": len(brief.products)
     }
-  }
+  })
 
-  # Add background task (for POC this runs synchronously but non-blocking)
-  background_tasks.add_task(
-    process_campaign_task,
+  # Hand off to the worker pool (see worker.py)
+  await app.state.redis_pool.enqueue_job(
+    "process_campaign_task",
     campaign_id,
-    brief,
+    brief.to_dict(),
     campaign_input.enable_copywriting
   )
 
@@ -215,11 +372,10 @@ async def get_campaign_status(campaign_id: str):
 
   Returns processing status and final report when complete.
   """
-  if campaign_id not in campaign_store:
+  campaign_data = await app.state.store.get(campaign_id)
+  if campaign_data is None:
     raise HTTPException(status_code=404, detail="Campaign not found")
 
-  campaign_data = campaign_store[campaign_id]
-
   return CampaignStatus(
     campaign_id=campaign_id,
     status=campaign_data["status"],
@@ -237,57 +393,32 @@ async def get_campaign_assets(campaign_id: str):
 
   Returns URLs to access each generated creative.
   """
-  if campaign_id not in campaign_store:
+  campaign_data = await app.state.store.get(campaign_id)
+  if campaign_data is None:
     raise HTTPException(status_code=404, detail="Campaign not found")
 
-  campaign_data = campaign_store[campaign_id]
-
   if campaign_data["status"] != "completed":
     raise HTTPException(
       status_code=400,
       detail=f"Campaign is {campaign_data['status']}, assets not available"
     )
 
-  # Build asset list from output directory
-  output_path = Path(campaign_data["output_path"])
-
-  # Handle nested campaign directory structure
-  nested_campaign_dir = output_path / campaign_id
-  if nested_campaign_dir.exists() and nested_campaign_dir.is_dir():
-    output_path = nested_campaign_dir
+  scan_dir = campaign_data.get("resolved_output_path")
+  if scan_dir is None:
+    # Campaign finished before the worker recorded its resolved path;
+    # resolve it once and remember it
+    resolved = resolve_campaign_path(OUTPUT_DIR, campaign_id)
+    if resolved is None:
+      raise HTTPException(status_code=404, detail="Campaign output not found")
+    scan_dir = str(resolved)
+    await app.state.store.update(campaign_id, resolved_output_path=scan_dir)
 
-  assets = []
-
-  # Scan directory for generated images
-  for product_dir in output_path.iterdir():
-    if product_dir.is_dir() and product_dir.name != "__pycache__":
-      # Check for language subdirectories
-      for lang_or_file in product_dir.iterdir():
-        if lang_or_file.is_dir():
-          # Language subdirectory
-          for image_file in lang_or_file.glob("*.jpg"):
-            # Skip hidden pre-overlay files used for compliance checking
-            if image_file.name.startswith('.'):
-              continue
-            assets.append({
-              "product": product_dir.name,
-              "language": lang_or_file.name,
-              "aspect_ratio": image_file.stem,
-              "url": f"/api/campaigns/{campaign_id}/assets/{product_dir.name}/{lang_or_file.name}/{image_file.name}",
-              "filename": image_file.name
-            })
-        elif lang_or_file.suffix == ".jpg":
-          # Direct image file (no localization)
-          # Skip hidden pre-overlay files
-          if lang_or_file.name.startswith('.'):
-            continue
-          assets.append({
-            "product": product_dir.name,
-            "language": "en",
-            "aspect_ratio": lang_or_file.stem,
-            "url": f"/api/campaigns/{campaign_id}/assets/{product_dir.name}/{lang_or_file.name}",
-            "filename": lang_or_file.name
-          })
+  # Build asset list from output directory
+  loop = asyncio.get_running_loop()
+  try:
+    assets = await loop.run_in_executor(SCAN_EXECUTOR, scan_campaign_assets, scan_dir)
+  except FileNotFoundError:
+    raise HTTPException(status_code=404, detail="Campaign output not found")
 
   return {
     "campaign_id": campaign_id,
@@ -296,70 +427,34 @@ async def get_campaign_assets(campaign_id: str):
   }
 
 
-@app.get("/api/campaigns/{campaign_id}/assets/{product}/{language}/{filename}")
-async def get_asset_file(campaign_id: str, product: str, language: str, filename: str):
-  """Serve a specific asset file."""
-  # Try to get from campaign store first
-  if campaign_id in campaign_store:
-    output_path = Path(campaign_store[campaign_id]["output_path"])
-  else:
-    # Fall back to filesystem scan for campaigns created before API started
-    output_path = OUTPUT_DIR / campaign_id
-    if not output_path.exists():
-      raise HTTPException(status_code=404, detail="Campaign not found")
-
-  # Handle nested campaign directory structure
-  nested_campaign_dir = output_path / campaign_id
-  if nested_campaign_dir.exists() and nested_campaign_dir.is_dir():
-    output_path = nested_campaign_dir
-
-  file_path = output_path / product / language / filename
-
-  if not file_path.exists():
-    raise HTTPException(status_code=404, detail="Asset not found")
-
-  return FileResponse(file_path, media_type="image/jpeg")
-
-
-@app.get("/api/campaigns/{campaign_id}/assets/{product}/{filename}")
-async def get_asset_file_no_lang(campaign_id: str, product: str, filename: str):
-  """Serve a specific asset file (no language subdirectory)."""
-  # Try to get from campaign store first
-  if campaign_id in campaign_store:
-    output_path = Path(campaign_store[campaign_id]["output_path"])
-  else:
-    # Fall back to filesystem scan for campaigns created before API started
-    output_path = OUTPUT_DIR / campaign_id
-    if not output_path.exists():
-      raise HTTPException(status_code=404, detail="Campaign not found")
-
-  # Handle nested campaign directory structure
-  nested_campaign_dir = output_path / campaign_id
-  if nested_campaign_dir.exists() and nested_campaign_dir.is_dir():
-    output_path = nested_campaign_dir
-
-  file_path = output_path / product / filename
-
-  if not file_path.exists():
-    raise HTTPException(status_code=404, detail="Asset not found")
-
-  return FileResponse(file_path, media_type="image/jpeg")
-
-
 @app.get("/api/campaigns")
 async def list_campaigns():
-  """List all campaigns."""
-  return {
-    "total": len(campaign_store),
-    "campaigns": [
-      {
-        "campaign_id": cid,
-        "status": data["status"],
-        "created_at": data["created_at"]
-      }
-      for cid, data in campaign_store.items()
-    ]
-  }
+  """
+  List all campaigns.
+
+  Records are fetched and serialized in batches and streamed out, so memory
+  use stays flat however many campaigns exist. "total" is written after the
+  list because campaigns can expire between listing ids and fetching them.
+  """
+  campaign_ids = await app.state.store.list_ids()
+
+  async def generate():
+    total = 0
+    yield b'{"campaigns":['
+    for start in range(0, len(campaign_ids), LIST_BATCH_SIZE):
+      records = await app.state.store.get_many(campaign_ids[start:start + LIST_BATCH_SIZE])
+      for cid, data in records.items():
+        entry = orjson.dumps({
+          "campaign_id": cid,
+          "status": data["status"],
+          # Stored as epoch seconds; formatted only for the response
+          "created_at": datetime.fromtimestamp(data["created_at"]).isoformat()
+        })
+        yield entry if total == 0 else b"," + entry
+        total += 1
+    yield b'],"total":' + str(total).encode() + b"}"
+
+  return StreamingResponse(generate(), media_type="application/json")
 
 
 @app.post("/api/upload")
@@ -378,11 +473,13 @@ async def upload_image(file: UploadFile = File(...)):
   unique_filename = f"{uuid.uuid4().hex}{file_extension}"
   file_path = UPLOADS_DIR / unique_filename
 
-  # Save uploaded file
+  # Stream uploaded file to disk without blocking the event loop
   try:
-    with file_path.open("wb") as buffer:
-      shutil.copyfileobj(file.file, buffer)
+    async with aiofiles.open(file_path, "wb") as out:
+      while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        await out.write(chunk)
   except Exception as e:
+    file_path.unlink(missing_ok=True)
     raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
   return {
@@ -393,17 +490,6 @@ async def upload_image(file: UploadFile = File(...)):
   }
 
 
-@app.get("/api/uploads/{filename}")
-async def get_uploaded_file(filename: str):
-  """Serve an uploaded file."""
-  file_path = UPLOADS_DIR / filename
-
-  if not file_path.exists():
-    raise HTTPException(status_code=404, detail="File not found")
-
-  return FileResponse(file_path, media_type="image/jpeg")
-
-
 @app.get("/api/generated-images")
 async def list_generated_images():
   """
@@ -411,47 +497,32 @@ async def list_generated_images():
 
   Returns a list of images that can be reused as existing_assets.
   """
-  generated_images = []
+  global _generated_images_cache
 
-  # Scan all campaign output directories
-  for campaign_dir in OUTPUT_DIR.iterdir():
-    if not campaign_dir.is_dir():
-      continue
+  loop = asyncio.get_running_loop()
+  campaign_dirs, fingerprint = await loop.run_in_executor(SCAN_EXECUTOR, list_campaign_dirs)
 
-    campaign_id = campaign_dir.name
+  # Nothing changed on disk since the last scan
+  if _generated_images_cache is not None and _generated_images_cache[0] == fingerprint:
+    return _generated_images_cache[1]
 
-    # Handle nested campaign directory structure
-    scan_dir = campaign_dir
-    nested_campaign_dir = campaign_dir / campaign_id
-    if nested_campaign_dir.exists() and nested_campaign_dir.is_dir():
-      scan_dir = nested_campaign_dir
-
-    # Scan for product images
-    for product_dir in scan_dir.iterdir():
-      if not product_dir.is_dir() or product_dir.name == "__pycache__":
-        continue
-
-      product_name = product_dir.name
-
-      # Look for source images (DALL-E generated, before variations)
-      source_image = product_dir / "source.jpg"
-      if source_image.exists():
-        generated_images.append({
-          "campaign_id": campaign_id,
-          "product": product_name,
-          "filename": "source.jpg",
-          "url": f"/api/campaigns/{campaign_id}/assets/{product_name}/source.jpg",
-          "absolute_path": str(source_image.absolute()),
-          "created_at": datetime.fromtimestamp(source_image.stat().st_mtime).isoformat()
-        })
+  # Scan campaign output directories concurrently
+  per_campaign = await asyncio.gather(*[
+    loop.run_in_executor(SCAN_EXECUTOR, scan_source_images, campaign_dir, campaign_id)
+    for campaign_dir, campaign_id in campaign_dirs
+  ])
+  generated_images = [image for images in per_campaign for image in images]
 
   # Sort by creation time (newest first)
   generated_images.sort(key=lambda x: x["created_at"], reverse=True)
 
-  return {
+  result = {
     "total": len(generated_images),
     "images": generated_images
   }
+  _generated_images_cache = (fingerprint, result)
+
+  return result
 
 
 @app.get("/api/campaigns/{campaign_id}/progress")
@@ -461,15 +532,16 @@ async def get_campaign_progress(campaign_id: str):
 
   Returns a list of all progress updates in chronological order.
   """
-  if campaign_id not in campaign_store:
+  campaign_data = await app.state.store.get(campaign_id)
+  if campaign_data is None:
     raise HTTPException(status_code=404, detail="Campaign not found")
 
   # Get progress updates
-  progress_updates = progress_store.get(campaign_id, [])
+  progress_updates = await app.state.store.get_progress(campaign_id)
 
   return {
     "campaign_id": campaign_id,
-    "status": campaign_store[campaign_id]["status"],
+    "status": campaign_data["status"],
     "total_updates": len(progress_updates),
     "progress_updates": progress_updates
   }
@@ -477,4 +549,4 @@ async def get_campaign_progress(campaign_id: str):
 
 if __name__ == "__main__":
   import uvicorn
-  uvicorn.run(app, host="0.0.0.0", port=8000)
+  uvicorn.run(app, host="0.0.0.0", port=8000, http="httptools", loop="uvloop")
@@ -14,6 +14,7 @@ from dotenv import load_dotenv
 
 from .models.campaign import CampaignBrief
 from .pipeline.orchestrator import CampaignPipeline
+from .utils.log_utils import start_queue_logging
 
 
 def setup_logging(verbose: bool = False):
@@ -24,14 +25,16 @@ def setup_logging(verbose: bool = False):
     verbose: Enable debug logging if True
   """
   level = logging.DEBUG if verbose else logging.INFO
-  logging.basicConfig(
-    level=level,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-      logging.FileHandler('pipeline.log'),
-      logging.StreamHandler()
-    ]
-  )
+  formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+  handlers = [
+    logging.FileHandler('pipeline.log'),
+    logging.StreamHandler()
+  ]
+  for handler in handlers:
+    handler.setFormatter(formatter)
+
+  # Written from a background thread, so render threads never block on I/O
+  start_queue_logging(handlers, level)
 
 
 def load_brief(brief_path: Path) -> dict:
@@ -271,6 +271,10 @@ class CampaignPipeline:
     )
 
     with Image.open(asset_path) as img:
+      # Decode large JPEGs at reduced scale (and straight to RGB); variations
+      # are far smaller. Other modes are converted once after decoding
+      self.composer.draft_for_variations(img)
+      img.load()
       if img.mode != 'RGB':
         img = img.convert('RGB')
 
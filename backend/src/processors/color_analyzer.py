@@ -5,8 +5,39 @@ This module analyzes image regions and selects optimal text and background color
 that meet both brand guidelines and WCAG accessibility standards.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Tuple
-from ..utils.color_utils import hex_to_rgb, calculate_contrast_ratio, relative_luminance
+
+import numpy as np
+
+from ..utils.color_utils import (
+    hex_to_rgb,
+    calculate_contrast_ratio,
+    relative_luminance,
+)
+
+
+RGB = Tuple[int, int, int]
+
+
+@lru_cache(maxsize=64)
+def _split_palette(brand_colors: Tuple[str, ...]) -> Tuple[Tuple[RGB, ...], Tuple[RGB, ...]]:
+    """
+    Parse a brand palette and split it into light and dark colors, once.
+
+    A campaign uses one palette for every creative, so the hex parsing and
+    luminance checks run once per palette instead of once per overlay.
+
+    Args:
+        brand_colors: Hex color codes, in brand order
+
+    Returns:
+        Tuple of (light_colors, dark_colors) as RGB tuples, each in brand order
+    """
+    brand_rgb = [hex_to_rgb(c) for c in brand_colors]
+    light_colors = tuple(c for c in brand_rgb if relative_luminance(c) > 0.5)
+    dark_colors = tuple(c for c in brand_rgb if relative_luminance(c) <= 0.5)
+    return light_colors, dark_colors
 
 
 class ColorAnalyzer:
@@ -62,6 +93,8 @@ class ColorAnalyzer:
         Args:
             region_analysis: Dictionary containing:
                 - average_color: RGB tuple of background region
+                - dominant_color: Optional most common background color, used
+                  instead of average_color when present
                 - is_light: Boolean indicating if background is light
                 - luminance: Relative luminance value
             brand_colors: List of hex color codes (e.g., ["#FF0000", "#0000FF"])
@@ -80,18 +113,20 @@ class ColorAnalyzer:
             >>> result['contrast_ratio'] >= 7.0
             True
         """
-        # Parse brand colors to RGB
-        brand_rgb = [hex_to_rgb(c) for c in brand_colors]
-        image_bg_color = region_analysis["average_color"]
+        # Imported here so Numba (when installed) only loads once colors are needed
+        from ..utils.color_math import best_contrast_u8, contrast_batch_u8
 
-        # Separate light and dark brand colors
-        light_colors = [c for c in brand_rgb if self._is_light(c)]
-        dark_colors = [c for c in brand_rgb if self._is_dark(c)]
+        # Judge contrast against the dominant background color when the
+        # analysis has one (the mean can be a color no pixel actually has)
+        image_bg_color = region_analysis.get("dominant_color", region_analysis["average_color"])
 
         # Default fallbacks
         white = (255, 255, 255)
         black = (0, 0, 0)
 
+        # Separate light and dark brand colors (parsed once per palette)
+        light_colors, dark_colors = _split_palette(tuple(brand_colors))
+
         # Determine which brand colors to use based on image background
         if region_analysis["is_light"]:
             # Light image background - need dark text
@@ -102,32 +137,44 @@ class ColorAnalyzer:
             text_candidates = light_colors or [white]
             outline_candidates = dark_colors or [black]
 
-        # Find best text color that contrasts with the actual image background
+        # Best text color is the highest-contrast candidate meeting the minimum.
+        # Candidates are not pre-sorted by luminance gap: the text group can
+        # straddle the background luminance, where the gap does not rank ratios.
         best_combo = None
-        best_ratio = 0
-
-        for text_color in text_candidates:
-            # Test contrast between text and actual image background
-            ratio = calculate_contrast_ratio(text_color, image_bg_color)
-            if ratio >= self.min_contrast_ratio and ratio > best_ratio:
-                best_ratio = ratio
-                # Choose outline color that contrasts with text
-                outline_color = None
-                for outline in outline_candidates:
-                    outline_ratio = calculate_contrast_ratio(text_color, outline)
-                    if outline_ratio >= 3.0:  # Lower threshold for outline
-                        outline_color = outline
-                        break
-
-                if not outline_color:
-                    # Use opposite of text color as fallback
-                    outline_color = white if self._is_dark(text_color) else black
 
-                best_combo = {
-                    "text_color": text_color,
-                    "bg_color": outline_color,  # Used for outline/stroke
-                    "contrast_ratio": ratio
-                }
+        if len(text_candidates) == 1:
+            # Trivially optimal (e.g. the pure black/white fallback): there is
+            # nothing to rank, so skip the array setup and use the cached ratio
+            best_idx = 0
+            best_ratio = calculate_contrast_ratio(text_candidates[0], image_bg_color)
+            found = best_ratio >= self.min_contrast_ratio
+        else:
+            # Rank every text candidate against the actual image background
+            # in one compiled/vectorized call; ties go to the first candidate
+            best_idx, best_ratio = best_contrast_u8(
+                text_candidates, image_bg_color, self.min_contrast_ratio
+            )
+            found = best_idx >= 0
+
+        if found:
+            text_color = text_candidates[best_idx]
+
+            # Choose the first outline color that contrasts with the text
+            outline_ratios = contrast_batch_u8([text_color], outline_candidates)[0]
+            outline_ok = outline_ratios >= 3.0  # Lower threshold for outline
+
+            if outline_ok.any():
+                outline_color = outline_candidates[int(np.argmax(outline_ok))]
+            else:
+                # Use opposite of text color as fallback (text is dark on
+                # light backgrounds and light on dark ones)
+                outline_color = white if region_analysis["is_light"] else black
+
+            best_combo = {
+                "text_color": text_color,
+                "bg_color": outline_color,  # Used for outline/stroke
+                "contrast_ratio": best_ratio
+            }
 
         # If no brand colors meet strict contrast requirements, use white/black for maximum readability
         # Scrim color should be opposite of text for maximum contrast
@@ -5,19 +5,185 @@ This module orchestrates specialized components to create professional social me
 creatives with text overlays, brand-compliant colors, and multi-language support.
 """
 
+import atexit
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Tuple, Optional, Dict, List
+from typing import Tuple, Optional, Dict, Iterable, Iterator, List, Hashable, Sequence
 
+import numpy as np
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 
 from ..models.campaign import AspectRatio
-from ..utils.image_utils import ensure_rgb
+from ..utils.image_utils import ensure_rgb, encode_jpeg, PILLOW_SIMD
+from ..utils.log_utils import get_log_queue, install_queue_handler
+from ..utils.path_utils import atomic_write_bytes
 from .font_manager import FontManager
 from .text_layout_engine import TextLayoutEngine
 from .color_analyzer import ColorAnalyzer
 from .gradient_renderer import GradientRenderer
 
 
+logger = logging.getLogger(__name__)
+
+# Aspect ratios to render as (display_name, ratio, dimensions), fixed for the
+# lifetime of the process and unpacked once so loops avoid enum lookups
+_ASPECT_SPECS = tuple(
+  (aspect_ratio.display_name, aspect_ratio.ratio, aspect_ratio.dimensions)
+  for aspect_ratio in AspectRatio.all()
+)
+
+# The same aspect ratios as one (N, 2) integer array, in _ASPECT_SPECS order,
+# so crop boxes for all of them are computed in a single vectorized pass
+_RATIOS = np.array([ratio for _, ratio, _ in _ASPECT_SPECS], dtype=np.int64)
+
+# Threads used to render variations concurrently
+VARIATION_WORKERS = os.cpu_count() or 1
+
+# Processes used to render variations (0 = render on threads instead). Off by
+# default: workers already run one pipeline process per CPU, and each render
+# process holds its own copy of the images it is working on.
+VARIATION_PROCESSES = int(os.getenv("VARIATION_PROCESSES", "0"))
+
+# Threads used to encode and write JPEGs in the background
+JPEG_WRITE_WORKERS = 4
+
+# Encode final creatives as progressive JPEGs: smaller uploads, but about
+# three times the encode time of baseline. Pre-overlays always stay baseline
+JPEG_PROGRESSIVE = os.getenv("JPEG_PROGRESSIVE", "0") == "1"
+
+# Smallest fraction of the base font size used when shrinking text to fit
+MIN_FONT_SCALE = 0.6
+
+# Downscale factor from which LANCZOS is used; milder resizes use BICUBIC,
+# which looks the same there at under half the kernel taps
+LANCZOS_MIN_DOWNSCALE = 2.0
+
+# Downscales beyond this many times the target size first reduce with a fast
+# box filter (Image.reduce) to within this factor, then resample the rest
+RESIZE_REDUCING_GAP = 3.0
+
+# JPEG sources are decoded at reduced scale (1/2, 1/4 or 1/8) as long as
+# every variation still resamples from at least this many times its size
+DRAFT_OVERSAMPLE = 2
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+# Composer used by render processes (one per process, created on first task)
+_process_composer: Optional["CreativeComposer"] = None
+
+# Cached analyses or text masks a render process keeps before starting over.
+# Its composer outlives every campaign, so its caches are never reset by
+# create_variations() the way the parent's are
+_PROCESS_CACHE_LIMIT = 256
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+  """Return the shared variation render process pool, starting it on first use."""
+  global _process_pool
+  with _process_pool_lock:
+    if _process_pool is None:
+      # Spawn rather than fork: callers may hold threads and open connections.
+      # Render processes log through this process's queue when there is one
+      log_queue = get_log_queue()
+      _process_pool = ProcessPoolExecutor(
+        max_workers=VARIATION_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=install_queue_handler if log_queue is not None else None,
+        initargs=(log_queue, logging.getLogger().level) if log_queue is not None else ()
+      )
+      atexit.register(_process_pool.shutdown, wait=True, cancel_futures=True)
+    return _process_pool
+
+
+# Image in shared memory, passed to render processes: (block name, size, mode)
+SharedImage = Tuple[str, Tuple[int, int], str]
+
+
+def _share_image(image: Image.Image) -> Tuple[SharedMemory, SharedImage]:
+  """
+  Copy an image's pixels into a new shared memory block.
+
+  The caller owns the block and must close() and unlink() it once no render
+  process needs it anymore.
+
+  Args:
+    image: Image to share
+
+  Returns:
+    Tuple of (shared_memory_block, handle for _attach_image)
+  """
+  data = image.tobytes()
+  shm = SharedMemory(create=True, size=max(len(data), 1))
+  shm.buf[:len(data)] = data
+  return shm, (shm.name, image.size, image.mode)
+
+
+def _attach_image(handle: SharedImage) -> Image.Image:
+  """
+  Load an image shared with _share_image into this process.
+
+  Returns:
+    Private copy of the image (the shared block is detached again)
+  """
+  name, size, mode = handle
+  shm = SharedMemory(name=name)
+  try:
+    return Image.frombytes(mode, size, shm.buf)
+  finally:
+    shm.close()
+
+
+def _render_variant_in_process(image_handle: SharedImage, pre_overlay_path: Path,
+                               message: str, output_dir: Path, name: str,
+                               language_code: Optional[str],
+                               brand_colors: Optional[List[str]]) -> Tuple[Path, Path]:
+  """
+  Render and write one variation inside a render process.
+
+  Args:
+    image_handle: Cropped and resized base image, shared by the parent
+    pre_overlay_path: Path of this aspect ratio's pre-overlay image
+    message: Text message to overlay
+    output_dir: Directory to save into
+    name: Aspect ratio display name (used for the filename)
+    language_code: Optional language code for font selection
+    brand_colors: Optional list of brand colors in hex format
+
+  Returns:
+    Tuple of (final_path, pre_overlay_path)
+  """
+  global _process_composer
+  if _process_composer is None:
+    _process_composer = CreativeComposer()
+  elif max(len(_process_composer._analysis_cache),
+           len(_process_composer._text_mask_cache)) >= _PROCESS_CACHE_LIMIT:
+    _process_composer._clear_caches()
+
+  # The shared block's name identifies the base image for as long as it
+  # exists (names are random and never reused), so languages rendered in
+  # the same process reuse its region analysis like threads do. The
+  # attached image is a private copy, so it can be drawn on directly
+  resized = _attach_image(image_handle)
+  final = _process_composer.add_text_overlay(resized, message, position=None,
+                                             language_code=language_code,
+                                             brand_colors=brand_colors,
+                                             analysis_key=image_handle[0],
+                                             in_place=True)
+  output_path = output_dir / f"{name}.jpg"
+  CreativeComposer._write_jpeg(final, output_path)
+  return output_path, pre_overlay_path
+
+
 class CreativeComposer:
   """
   Orchestrates image processing for creating social media creatives.
@@ -43,11 +209,15 @@ class CreativeComposer:
     ... )
   """
 
-  def __init__(self):
+  def __init__(self, locales: Optional[Sequence[str]] = None):
     """
     Initialize the creative composer with specialized components.
 
     Sets up dependency injection for all specialized processors.
+
+    Args:
+      locales: Optional language codes to preload fonts for, so the first
+              overlay in each language does not pay for the font search
     """
     # Initialize specialized components
     self.font_manager = FontManager()
@@ -55,49 +225,188 @@ class CreativeComposer:
     self.color_analyzer = ColorAnalyzer(min_contrast_ratio=7.0)
     self.gradient_renderer = GradientRenderer(max_alpha=150, fade_exponent=2.0)
 
+    # (analysis_key, position, brand_colors) -> (region_analysis, colors), so
+    # languages sharing a base image reuse one region scan and color choice
+    self._analysis_cache: Dict[tuple, Tuple[Dict, Dict]] = {}
 
-  def smart_crop(self, image: Image.Image, target_ratio: Tuple[int, int]) -> Image.Image:
+    # (brand_colors, 5-bit quantized region color, is_light) -> colors, so
+    # regions with near-identical backgrounds (e.g. the same photo cropped to
+    # different aspect ratios) share one color selection
+    self._color_cache: Dict[tuple, Dict] = {}
+
+    # (message, font, max_width) -> (wrapped_text, text_width, text_height)
+    self._layout_cache: Dict[tuple, Tuple[str, int, int]] = {}
+
+    # (wrapped_text, font) -> (glyph coverage mask, offset), so aspect ratios
+    # of equal width (same font and wrap) rasterize the text only once
+    self._text_mask_cache: Dict[tuple, Tuple[Image.Image, Tuple[int, int]]] = {}
+
+    # Drawing context used only to measure text, shared by all overlays.
+    # Measuring never touches its 1x1 'L' image ('L' is the font mode used
+    # for RGB images), so overlays only create a Draw for the final text
+    self._measure_draw = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+    # Background JPEG encoding and writing, kept for the composer's lifetime
+    self._io_pool = ThreadPoolExecutor(max_workers=JPEG_WRITE_WORKERS,
+                                       thread_name_prefix="jpeg-write")
+
+    # Crop/resize and overlay rendering, also kept for the composer's
+    # lifetime rather than started and joined for every product
+    self._render_pool = ThreadPoolExecutor(max_workers=VARIATION_WORKERS,
+                                           thread_name_prefix="variation")
+
+    logger.debug("Image backend: %s %s", "Pillow-SIMD" if PILLOW_SIMD else "Pillow",
+                 PIL.__version__)
+
+    if locales:
+      self.preload_fonts(locales)
+
+  def _clear_caches(self) -> None:
+    """Drop cached analyses, color selections, layouts and text masks."""
+    self._analysis_cache.clear()
+    self._color_cache.clear()
+    self._layout_cache.clear()
+    self._text_mask_cache.clear()
+
+  @staticmethod
+  def _base_font_size(image_width: int) -> int:
+    """Overlay font size for an image width, before any shrinking to fit."""
+    # Aim for readable text that scales with image size
+    return max(24, min(72, image_width // 15))
+
+  def preload_fonts(self, language_codes: Iterable[Optional[str]]) -> None:
     """
-    Intelligently crop an image to a target aspect ratio.
+    Load the overlay fonts for the given languages ahead of rendering.
 
-    Crops from the center to maintain the focal point.
+    Covers the base font size of every aspect ratio; the smaller sizes used
+    for text that has to shrink to fit are still loaded on demand.
 
     Args:
-      image: Source image to crop
+      language_codes: Language codes (None for the default font)
+    """
+    font_sizes = {self._base_font_size(width) for _, _, (width, _) in _ASPECT_SPECS}
+    self.font_manager.preload(language_codes, font_sizes)
+
+  @staticmethod
+  @lru_cache(maxsize=64)
+  def _compute_crop_box(width: int, height: int,
+                        target_ratio: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    """
+    Compute the centered crop box that gives an image a target aspect ratio.
+
+    Results are cached per (source size, ratio): campaigns reuse the same
+    few source sizes and aspect ratios across products and runs.
+
+    Args:
+      width: Source width in pixels
+      height: Source height in pixels
       target_ratio: Target aspect ratio as (width, height)
 
     Returns:
-      Cropped image
+      Crop box as (left, top, right, bottom); the full image if it already
+      has the target ratio
     """
     target_width_ratio, target_height_ratio = target_ratio
 
-    # Get current dimensions
-    width, height = image.size
-    current_ratio = width / height
-    target_ratio_value = target_width_ratio / target_height_ratio
+    # Compare width/height against the target ratio by cross-multiplying,
+    # which is exact for integer sizes (no division or tolerance needed)
+    lhs = width * target_height_ratio
+    rhs = height * target_width_ratio
 
-    if abs(current_ratio - target_ratio_value) < 0.01:
+    if lhs == rhs:
       # Already the correct ratio
-      return image
+      return (0, 0, width, height)
 
-    if current_ratio > target_ratio_value:
+    if lhs > rhs:
       # Image is wider than target - crop width
-      new_width = int(height * target_ratio_value)
+      new_width = rhs // target_height_ratio
       left = (width - new_width) // 2
-      crop_box = (left, 0, left + new_width, height)
-    else:
-      # Image is taller than target - crop height
-      new_height = int(width / target_ratio_value)
-      top = (height - new_height) // 2
-      crop_box = (0, top, width, top + new_height)
+      return (left, 0, left + new_width, height)
+
+    # Image is taller than target - crop height
+    new_height = lhs // target_width_ratio
+    top = (height - new_height) // 2
+    return (0, top, width, top + new_height)
+
+  @staticmethod
+  @lru_cache(maxsize=16)
+  def compute_all_crop_boxes(width: int, height: int) -> np.ndarray:
+    """
+    Compute the centered crop box of every aspect ratio at once.
+
+    Vectorized equivalent of _compute_crop_box over all aspect ratios (same
+    integer arithmetic, so the boxes are identical). Cached per source size;
+    the returned array is read-only.
+
+    Args:
+      width: Source width in pixels
+      height: Source height in pixels
+
+    Returns:
+      (N, 4) int64 array of (left, top, right, bottom) rows, one per aspect
+      ratio in AspectRatio.all() order
+    """
+    target_width_ratio, target_height_ratio = _RATIOS[:, 0], _RATIOS[:, 1]
+    lhs = width * target_height_ratio
+    rhs = height * target_width_ratio
+
+    # Wider than target: crop width; taller: crop height; equal: keep both
+    new_width = np.where(lhs > rhs, rhs // target_height_ratio, width)
+    new_height = np.where(lhs < rhs, lhs // target_width_ratio, height)
+    left = (width - new_width) // 2
+    top = (height - new_height) // 2
+
+    boxes = np.stack([left, top, left + new_width, top + new_height], axis=1)
+    boxes.setflags(write=False)
+    return boxes
+
+  def smart_crop(self, image: Image.Image, target_ratio: Tuple[int, int]) -> Image.Image:
+    """
+    Intelligently crop an image to a target aspect ratio.
+
+    Crops from the center to maintain the focal point.
+
+    Args:
+      image: Source image to crop
+      target_ratio: Target aspect ratio as (width, height)
+
+    Returns:
+      Cropped image
+    """
+    crop_box = self.smart_crop_box(image, target_ratio)
+    if crop_box == (0, 0, *image.size):
+      return image
 
     return image.crop(crop_box)
 
+  def smart_crop_box(self, image: Image.Image,
+                     target_ratio: Tuple[int, int]) -> Tuple[int, int, int, int]:
+    """
+    Compute the region smart_crop() would keep, without cropping.
+
+    Pass the box to resize_with_box() to crop and resize in a single
+    resampling pass instead of allocating an intermediate cropped image.
+
+    Args:
+      image: Source image
+      target_ratio: Target aspect ratio as (width, height)
+
+    Returns:
+      Crop box as (left, top, right, bottom)
+
+    Examples:
+      >>> composer = CreativeComposer()
+      >>> box = composer.smart_crop_box(image, (9, 16))
+      >>> resized = composer.resize_with_box(image, (1080, 1920), box)
+    """
+    return self._compute_crop_box(*image.size, target_ratio)
+
   def resize_to_dimensions(self, image: Image.Image, dimensions: Tuple[int, int]) -> Image.Image:
     """
     Resize an image to specific dimensions.
 
-    Uses high-quality resampling.
+    Uses high-quality resampling; large downscales are pre-reduced with a
+    box filter (see RESIZE_REDUCING_GAP).
 
     Args:
       image: Source image
@@ -106,11 +415,85 @@ class CreativeComposer:
     Returns:
       Resized image
     """
-    return image.resize(dimensions, Image.Resampling.LANCZOS)
+    return image.resize(dimensions, self._resample_filter(image.size, dimensions),
+                        reducing_gap=RESIZE_REDUCING_GAP)
+
+  def resize_with_box(self, image: Image.Image, dimensions: Tuple[int, int],
+                      box: Tuple[int, int, int, int]) -> Image.Image:
+    """
+    Resize a region of an image to specific dimensions in a single pass.
+
+    Equivalent to crop() followed by resize_to_dimensions(), but the resampler
+    reads the region directly, so no intermediate cropped image is allocated.
+
+    Args:
+      image: Source image
+      dimensions: Target dimensions as (width, height)
+      box: Source region as (left, top, right, bottom)
+
+    Returns:
+      Resized image (the source itself if no crop or resize is needed)
+    """
+    if box == (0, 0, *image.size) and image.size == tuple(dimensions):
+      return image
+
+    left, top, right, bottom = box
+    resample = self._resample_filter((right - left, bottom - top), dimensions)
+    return image.resize(dimensions, resample, box=box, reducing_gap=RESIZE_REDUCING_GAP)
+
+  @staticmethod
+  def _resample_filter(source_size: Tuple[int, int],
+                       dimensions: Tuple[int, int]) -> Image.Resampling:
+    """
+    Pick the resampling filter for resizing a region to target dimensions.
+
+    LANCZOS only pays off for strong downscales; for anything milder
+    (including upscales) BICUBIC is visually indistinguishable and cheaper.
+
+    Args:
+      source_size: Size of the source region as (width, height)
+      dimensions: Target dimensions as (width, height)
+
+    Returns:
+      Resampling filter for Image.resize()
+    """
+    downscale = min(source_size[0] / dimensions[0], source_size[1] / dimensions[1])
+    if downscale >= LANCZOS_MIN_DOWNSCALE:
+      return Image.Resampling.LANCZOS
+    return Image.Resampling.BICUBIC
+
+  def draft_for_variations(self, image: Image.Image) -> None:
+    """
+    Configure a JPEG to decode at the smallest scale the variations allow.
+
+    JPEG decoders can downscale by 1/2, 1/4 or 1/8 while decoding, skipping
+    most of the inverse DCT work. The scale is chosen so that every aspect
+    ratio crop still has DRAFT_OVERSAMPLE times its target resolution.
+    Must be called on a freshly opened image, before its pixels are loaded;
+    it does nothing for other formats.
+
+    Args:
+      image: Image returned by Image.open()
+    """
+    if image.format != "JPEG":
+      return
+
+    width, height = image.size
+    boxes = self.compute_all_crop_boxes(width, height)
+    scale = 0.0
+    for (_, _, (target_width, target_height)), (left, top, right, bottom) in zip(
+        _ASPECT_SPECS, boxes.tolist()):
+      scale = max(scale, target_width / (right - left), target_height / (bottom - top))
+
+    scale *= DRAFT_OVERSAMPLE
+    if scale < 1.0:
+      image.draft("RGB", (math.ceil(width * scale), math.ceil(height * scale)))
 
   def add_text_overlay(self, image: Image.Image, message: str,
                        position: str = None, language_code: Optional[str] = None,
-                       brand_colors: Optional[List[str]] = None) -> Image.Image:
+                       brand_colors: Optional[List[str]] = None,
+                       analysis_key: Optional[Hashable] = None,
+                       in_place: bool = False) -> Image.Image:
     """
     Add brand-aware text overlay with smart positioning and clean typography.
 
@@ -124,9 +507,15 @@ class CreativeComposer:
                provided, uses smart positioning
       language_code: Optional language code for font selection (e.g., 'ar', 'he', 'zh')
       brand_colors: Optional list of brand colors in hex format for brand-aware text
+      analysis_key: Optional key identifying the image content. Overlays with the
+                   same key reuse the cached region analysis and color selection,
+                   so different images must use different keys
+      in_place: Draw onto image itself instead of a copy when it is already
+               RGB. Only for callers that own the image and do not need the
+               original pixels afterwards
 
     Returns:
-      Image with text overlay
+      Image with text overlay (image itself if drawn in place)
 
     Examples:
       >>> composer = CreativeComposer()
@@ -137,15 +526,26 @@ class CreativeComposer:
       ...     brand_colors=["#FF6B35", "#004E89"]
       ... )
     """
-    # Work on a copy
-    img = image.copy().convert('RGBA')
+    # Work in RGB throughout (the JPEG output mode). A non-RGB input is
+    # converted into a new image, which is then safe to draw on
+    img = ensure_rgb(image)
 
     # Step 1: Analyze text region and select colors using specialized components
     if brand_colors and len(brand_colors) > 0:
-      # Delegate to TextLayoutEngine for region analysis
-      region_analysis = self.layout_engine.analyze_text_region(image, position)
-      # Delegate to ColorAnalyzer for color selection
-      colors = self.color_analyzer.select_text_colors(region_analysis, brand_colors)
+      cache_key = (analysis_key, position, tuple(brand_colors))
+      cached = self._analysis_cache.get(cache_key) if analysis_key is not None else None
+      if cached:
+        region_analysis, colors = cached
+      else:
+        # Delegate to TextLayoutEngine for region analysis, on a small pixel
+        # sample rather than a full-resolution copy of the image
+        region_analysis = self.layout_engine.analyze_text_region(
+          img, position, pixels=self.layout_engine.sample_pixels(img)
+        )
+        # Delegate to ColorAnalyzer for color selection
+        colors = self._select_text_colors(region_analysis, brand_colors)
+        if analysis_key is not None:
+          self._analysis_cache[cache_key] = (region_analysis, colors)
       # Use the smart position if no specific position was requested
       if not position:
         position = region_analysis["position"]
@@ -159,44 +559,35 @@ class CreativeComposer:
       position = position or "bottom"
 
     # Step 2: Calculate font size and load appropriate font
-    # Aim for readable text that scales with image size
-    font_size = max(24, min(72, img.width // 15))
+    font_size = self._base_font_size(img.width)
 
     # Delegate to FontManager for font loading
     font = self.font_manager.load_font_with_fallback(font_size, language_code)
 
     # Step 3: Wrap text and calculate dimensions
-    # Create drawing context for measuring text
-    draw = ImageDraw.Draw(img)
-
     # Define padding
     padding = 40  # Comfortable padding from edges
 
     # Calculate available width for text (leaving padding on both sides)
     max_text_width = img.width - (padding * 2)
 
-    # Delegate to TextLayoutEngine for text wrapping
-    wrapped_text = self.layout_engine.wrap_text(message, font, max_text_width, draw)
-
-    # Get text bounding box
-    bbox = draw.textbbox((0, 0), wrapped_text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
+    # Delegate to TextLayoutEngine for text wrapping and measure the result
+    wrapped_text, text_width, text_height = self._layout_text(message, font, max_text_width)
 
     # Step 4: Adjust font size if text is too large
-    max_attempts = 3
-    attempt = 0
-    while (text_width > max_text_width or text_height > img.height - padding * 4) and attempt < max_attempts:
-      font_size = int(font_size * 0.85)  # Reduce by 15%
+    # Text dimensions scale linearly with font size, so shrink in a single step
+    # to fit both limits instead of retrying in fixed 15% decrements
+    max_text_height = img.height - padding * 4
+    if text_width > max_text_width or text_height > max_text_height:
+      scale = min(1.0, max_text_width / max(text_width, 1), max_text_height / max(text_height, 1))
+      # Keep text legible on extreme aspect ratios (never below ~60% of the base size)
+      scale = max(scale, MIN_FONT_SCALE)
+      font_size = int(font_size * scale)
       # Reload font at smaller size
       font = self.font_manager.load_font_with_fallback(font_size, language_code)
 
       # Re-wrap with new font size
-      wrapped_text = self.layout_engine.wrap_text(message, font, max_text_width, draw)
-      bbox = draw.textbbox((0, 0), wrapped_text, font=font)
-      text_width = bbox[2] - bbox[0]
-      text_height = bbox[3] - bbox[1]
-      attempt += 1
+      wrapped_text, text_width, text_height = self._layout_text(message, font, max_text_width)
 
     # Step 5: Calculate text position
     # Map positions to coordinates
@@ -226,29 +617,278 @@ class CreativeComposer:
       text_y = img.height - text_height - padding * 2
 
     # Step 6: Create gradient overlay
-    # Delegate to GradientRenderer for creating the scrim
-    scrim_color = colors["bg_color"]
-    overlay = self.gradient_renderer.create_directional_gradient(
-      image_size=img.size,
+    # Delegate to GradientRenderer, which blends the solid scrim color in
+    # place. Unless the caller allows it, copy first: base images are shared
+    # between languages.
+    if img is image and not in_place:
+      img = img.copy()
+    self.gradient_renderer.apply_directional_gradient(
+      img,
       text_position=(text_x, text_y),
       text_size=(text_width, text_height),
-      scrim_color=scrim_color
+      scrim_color=colors["bg_color"]
     )
 
-    # Composite gradient overlay
-    img = Image.alpha_composite(img, overlay)
-
-    # Step 7: Draw text on top of gradient scrim
-    draw = ImageDraw.Draw(img)
-    text_color_with_alpha = (*colors["text_color"], 255)
-    draw.text((text_x, text_y), wrapped_text, fill=text_color_with_alpha, font=font)
+    # Step 7: Draw text on top of gradient scrim, blending the text color
+    # through the (possibly shared) rasterized glyph mask
+    text_mask, (offset_x, offset_y) = self._text_mask(wrapped_text, font)
+    img.paste(colors["text_color"], (text_x + offset_x, text_y + offset_y), text_mask)
 
     # Log contrast ratio for debugging (optional)
     if brand_colors:
-      print(f"    Text overlay contrast ratio: {colors.get('contrast_ratio', 0):.2f}:1")
+      logger.debug("Text overlay contrast ratio: %.2f:1", colors.get('contrast_ratio', 0))
+
+    return img
+
+  def _layout_text(self, message: str, font: ImageFont.FreeTypeFont,
+                   max_width: int) -> Tuple[str, int, int]:
+    """
+    Wrap a message to a pixel width and measure it, reusing earlier layouts.
+
+    Aspect ratios of equal width (e.g. 1x1 and 9x16) lay out the same message
+    with the same font identically, so the wrap and bounding box are cached.
+
+    Args:
+      message: Text to lay out
+      font: Loaded font (FontManager returns the same object for the same
+            size and language, so it identifies the font in the cache key)
+      max_width: Maximum line width in pixels
+
+    Returns:
+      Tuple of (wrapped_text, text_width, text_height)
+    """
+    layout_key = (message, font, max_width)
+    layout = self._layout_cache.get(layout_key)
+    if layout is None:
+      draw = self._measure_draw
+      wrapped_text = self.layout_engine.wrap_text(message, font, max_width, draw)
+      bbox = draw.textbbox((0, 0), wrapped_text, font=font)
+      layout = (wrapped_text, bbox[2] - bbox[0], bbox[3] - bbox[1])
+      self._layout_cache[layout_key] = layout
+    return layout
+
+  def _text_mask(self, wrapped_text: str,
+                 font: ImageFont.FreeTypeFont) -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Rasterize text into a coverage mask, reusing earlier renders.
+
+    Pasting a color through the mask gives the same pixels as drawing the
+    text in that color, so one render serves every color and position.
+
+    Args:
+      wrapped_text: Text to render (may contain newlines)
+      font: Loaded font (identifies the font in the cache key)
+
+    Returns:
+      Tuple of ('L' mask cropped to the text, (x, y) offset of the mask from
+      the text drawing position)
+    """
+    mask_key = (wrapped_text, font)
+    cached = self._text_mask_cache.get(mask_key)
+    if cached is None:
+      left, top, right, bottom = self._measure_draw.textbbox((0, 0), wrapped_text, font=font)
+      mask = Image.new('L', (max(right - left, 1), max(bottom - top, 1)), 0)
+      ImageDraw.Draw(mask).text((-left, -top), wrapped_text, fill=255, font=font)
+      cached = (mask, (left, top))
+      self._text_mask_cache[mask_key] = cached
+    return cached
+
+  def _select_text_colors(self, region_analysis: Dict, brand_colors: List[str]) -> Dict:
+    """
+    Select text colors for a region, reusing selections for similar backgrounds.
+
+    Args:
+      region_analysis: Output of TextLayoutEngine.analyze_text_region
+      brand_colors: List of brand colors in hex format
+
+    Returns:
+      Color selection from ColorAnalyzer.select_text_colors
+    """
+    r, g, b = region_analysis.get("dominant_color", region_analysis["average_color"])
+    # Brand color order is kept in the key: it breaks ties between candidates
+    color_key = (tuple(brand_colors), (r >> 3, g >> 3, b >> 3), region_analysis["is_light"])
+
+    colors = self._color_cache.get(color_key)
+    if colors is None:
+      colors = self.color_analyzer.select_text_colors(region_analysis, brand_colors)
+      self._color_cache[color_key] = colors
+    return colors
+
+  def _create_base_variant(self, source_image: Image.Image, dimensions: Tuple[int, int],
+                           crop_box: Tuple[int, int, int, int]) -> Tuple[Image.Image, bytes]:
+    """
+    Crop and resize the source image to one aspect ratio.
+
+    Args:
+      source_image: Source image to process
+      dimensions: Target dimensions as (width, height)
+      crop_box: Smart crop box for the aspect ratio (see compute_all_crop_boxes)
+
+    Returns:
+      Tuple of (resized_image, pre_overlay_jpeg_bytes)
+    """
+    # Smart crop to aspect ratio and resize to target dimensions in one pass
+    resized = self.resize_with_box(source_image, dimensions, crop_box)
+
+    # Encode the pre-overlay version once; callers write it wherever needed
+    return resized, encode_jpeg(resized)
+
+  def _create_base_variants(self, source_image: Image.Image,
+                            executor: ThreadPoolExecutor) -> Dict[str, Tuple[Image.Image, bytes]]:
+    """
+    Crop and resize the source image to every aspect ratio in parallel.
+
+    Args:
+      source_image: Source image to process
+      executor: Thread pool to run the per-ratio work on
+
+    Returns:
+      Dictionary mapping aspect ratio names to (resized_image, pre_overlay_jpeg_bytes)
+    """
+    # Make sure pixels are loaded before threads read them concurrently
+    source_image.load()
+
+    crop_boxes = self.compute_all_crop_boxes(*source_image.size).tolist()
+    futures = {
+      name: executor.submit(self._create_base_variant, source_image, dimensions, tuple(box))
+      for (name, _, dimensions), box in zip(_ASPECT_SPECS, crop_boxes)
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+  def _queue_pre_overlays(self, base_variants: Dict[str, Tuple[Image.Image, bytes]],
+                          output_dir: Path, io_pool: ThreadPoolExecutor,
+                          pending_writes: List[Future]) -> Dict[str, Path]:
+    """
+    Queue the pre-overlay image of every aspect ratio for writing.
+
+    Pre-overlay versions preserve the original colors before the gradient
+    scrim is applied and are used for brand color compliance checking. They
+    are language-independent, so each is written once.
+
+    Args:
+      base_variants: Output of _create_base_variants
+      output_dir: Directory to save into
+      io_pool: Thread pool for file writes
+      pending_writes: List the write futures are appended to
+
+    Returns:
+      Dictionary mapping aspect ratio names to pre-overlay paths
+    """
+    pre_overlay_paths = {}
+    for name, (_, pre_overlay_bytes) in base_variants.items():
+      pre_overlay_path = output_dir / f".{name}_pre_overlay.jpg"  # Hidden file
+      pending_writes.append(io_pool.submit(atomic_write_bytes, pre_overlay_path, pre_overlay_bytes))
+      pre_overlay_paths[name] = pre_overlay_path
+    return pre_overlay_paths
+
+  def _render_variant(self, resized: Image.Image, pre_overlay_path: Path,
+                      message: str, output_dir: Path, name: str,
+                      language_code: Optional[str],
+                      brand_colors: Optional[List[str]],
+                      io_pool: ThreadPoolExecutor,
+                      pending_writes: List[Future],
+                      in_place: bool = False) -> Tuple[Path, Path]:
+    """
+    Render one aspect ratio's final creative and queue its write.
+
+    Encoding and writing happen on io_pool, so this thread can move on to the
+    next overlay while the JPEG is encoded. Callers must wait on
+    pending_writes before the files are guaranteed to exist.
+
+    Args:
+      resized: Cropped and resized base image (modified only if in_place)
+      pre_overlay_path: Path of this aspect ratio's pre-overlay image
+      message: Text message to overlay
+      output_dir: Directory to save into
+      name: Aspect ratio display name (used for filenames and analysis reuse)
+      language_code: Optional language code for font selection
+      brand_colors: Optional list of brand colors in hex format
+      io_pool: Thread pool for JPEG encoding and file writes
+      pending_writes: List the write futures are appended to
+      in_place: Draw the overlay directly onto resized (see add_text_overlay)
+
+    Returns:
+      Tuple of (final_path, pre_overlay_path)
+    """
+    # Add text overlay with language-specific font, brand colors, and smart positioning
+    final = self.add_text_overlay(resized, message, position=None,
+                                  language_code=language_code, brand_colors=brand_colors,
+                                  analysis_key=name, in_place=in_place)
+
+    # Save the final creative
+    filename = f"{name}.jpg"
+    output_path = output_dir / filename
+
+    pending_writes.append(io_pool.submit(self._write_jpeg, final, output_path))
+
+    return output_path, pre_overlay_path
+
+  def _submit_render(self, executor: Executor, resized: Image.Image,
+                     pre_overlay_path: Path, message: str, output_dir: Path,
+                     name: str, language_code: Optional[str],
+                     brand_colors: Optional[List[str]],
+                     io_pool: ThreadPoolExecutor,
+                     pending_writes: List[Future],
+                     in_place: bool = False,
+                     shared: Optional[Dict[str, SharedImage]] = None) -> Future:
+    """
+    Submit one variation render to the process pool, or to executor (threads).
+
+    Render processes receive the base image through shared (see
+    _share_base_variants) rather than as a pickled argument.
+
+    Returns:
+      Future resolving to (final_path, pre_overlay_path)
+    """
+    if VARIATION_PROCESSES > 0:
+      return _get_process_pool().submit(
+        _render_variant_in_process, shared[name], pre_overlay_path, message,
+        output_dir, name, language_code, brand_colors
+      )
+
+    return executor.submit(
+      self._render_variant, resized, pre_overlay_path, message,
+      output_dir, name, language_code, brand_colors, io_pool, pending_writes,
+      in_place
+    )
+
+  @contextmanager
+  def _share_base_variants(self, base_variants: Dict[str, Tuple[Image.Image, bytes]]
+                           ) -> Iterator[Dict[str, SharedImage]]:
+    """
+    Place every base image in shared memory for the render processes.
 
-    # Convert back to RGB
-    return img.convert('RGB')
+    Each base image is copied into shared memory once, however many languages
+    render it, instead of being pickled into every task. The blocks are freed
+    when the context exits, so all renders must finish inside it. Yields an
+    empty mapping when rendering on threads.
+
+    Args:
+      base_variants: Output of _create_base_variants
+
+    Yields:
+      Dictionary mapping aspect ratio names to shared image handles
+    """
+    if VARIATION_PROCESSES <= 0:
+      yield {}
+      return
+
+    blocks: List[SharedMemory] = []
+    try:
+      shared = {}
+      for name, (resized, _) in base_variants.items():
+        shm, shared[name] = _share_image(resized)
+        blocks.append(shm)
+      yield shared
+    finally:
+      for shm in blocks:
+        shm.close()
+        shm.unlink()
+
+  @staticmethod
+  def _write_jpeg(image: Image.Image, path: Path) -> None:
+    """Encode a final creative as JPEG and atomically write it to path."""
+    atomic_write_bytes(path, encode_jpeg(image, progressive=JPEG_PROGRESSIVE))
 
   def create_variations(self, source_image: Image.Image, message: str,
                        output_dir: Path, product_name: str,
@@ -256,6 +896,9 @@ class CreativeComposer:
     """
     Create all aspect ratio variations from a source image.
 
+    Aspect ratios are rendered concurrently on a thread pool; Pillow releases
+    the GIL while resizing, compositing and encoding.
+
     Args:
       source_image: Source image to process
       message: Campaign message to overlay
@@ -268,33 +911,40 @@ class CreativeComposer:
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     results = {}
+    self._clear_caches()
 
-    for aspect_ratio in AspectRatio.all():
-      print(f"  Creating {aspect_ratio.display_name} variation...")
-
-      # Smart crop to aspect ratio
-      cropped = self.smart_crop(source_image, aspect_ratio.ratio)
+    io_pool = self._io_pool
+    pending_writes: List[Future] = []
 
-      # Resize to target dimensions
-      resized = self.resize_to_dimensions(cropped, aspect_ratio.dimensions)
+    # Load fonts up front rather than inside the first concurrent renders
+    self.preload_fonts([None])
 
-      # Save pre-overlay version for brand color compliance checking
-      # This preserves the original colors before gradient scrim is applied
-      pre_overlay_filename = f".{aspect_ratio.display_name}_pre_overlay.jpg"  # Hidden file
-      pre_overlay_path = output_dir / pre_overlay_filename
-      resized.save(pre_overlay_path, quality=95, optimize=True)
+    executor = self._render_pool
+    base_variants = self._create_base_variants(source_image, executor)
+    pre_overlay_paths = self._queue_pre_overlays(base_variants, output_dir,
+                                                 io_pool, pending_writes)
 
-      # Add text overlay with brand colors and smart positioning
-      final = self.add_text_overlay(resized, message, position=None, brand_colors=brand_colors)
+    with self._share_base_variants(base_variants) as shared:
+      futures = {}
+      for name, (resized, _) in base_variants.items():
+        logger.info("Creating %s variation...", name)
+        # Each base image gets a single overlay, so it is drawn on directly,
+        # unless no crop or resize was needed and it is the caller's source
+        futures[name] = self._submit_render(
+          executor, resized, pre_overlay_paths[name], message,
+          output_dir, name, None, brand_colors, io_pool, pending_writes,
+          in_place=resized is not source_image, shared=shared
+        )
 
-      # Save with quality optimization
-      filename = f"{aspect_ratio.display_name}.jpg"
-      output_path = output_dir / filename
+      for name, future in futures.items():
+        results[name] = future.result()
 
-      final.save(output_path, quality=95, optimize=True)
-      results[aspect_ratio.display_name] = (output_path, pre_overlay_path)
+    # Surface any write errors before reporting success
+    for write in pending_writes:
+      write.result()
 
-      print(f"    ✓ Saved: {output_path}")
+    for name, (output_path, _) in results.items():
+      logger.info("Saved: %s", output_path)
 
     return results
 
@@ -315,7 +965,10 @@ class CreativeComposer:
       Dictionary mapping aspect ratio names to (final_path, pre_overlay_path) tuples
     """
     with Image.open(image_path) as img:
-      # Convert to RGB if necessary
+      # Decode once, straight to RGB at reduced scale for JPEGs; any other
+      # mode is converted in a single pass over the decoded pixels
+      self.draft_for_variations(img)
+      img.load()
       img = ensure_rgb(img)
 
       return self.create_variations(img, message, output_dir, product_name, brand_colors)
@@ -340,41 +993,56 @@ class CreativeComposer:
     """
     results = {}
 
-    for lang_code, message in messages.items():
-      # Create language-specific subdirectory
-      lang_dir = output_dir / lang_code
-      lang_dir.mkdir(parents=True, exist_ok=True)
-
-      print(f"  Creating {lang_code} variations...")
+    # Every language overlays the same crop per aspect ratio, so region
+    # analysis and color selection are keyed by aspect ratio and shared
+    self._clear_caches()
 
-      # Create variations for this language
-      lang_results = {}
+    io_pool = self._io_pool
+    pending_writes: List[Future] = []
 
-      for aspect_ratio in AspectRatio.all():
-        # Smart crop to aspect ratio
-        cropped = self.smart_crop(source_image, aspect_ratio.ratio)
+    # Load every language's fonts up front rather than inside the first
+    # concurrent renders of each language
+    self.preload_fonts(messages)
 
-        # Resize to target dimensions
-        resized = self.resize_to_dimensions(cropped, aspect_ratio.dimensions)
+    executor = self._render_pool
+    # Crop, resize and encode the pre-overlay image once per aspect ratio;
+    # only the text overlay differs between languages
+    base_variants = self._create_base_variants(source_image, executor)
 
-        # Save pre-overlay version for brand color compliance checking
-        pre_overlay_filename = f".{aspect_ratio.display_name}_pre_overlay.jpg"  # Hidden file
-        pre_overlay_path = lang_dir / pre_overlay_filename
-        resized.save(pre_overlay_path, quality=95, optimize=True)
-
-        # Add localized text overlay with language-specific font, brand colors, and smart positioning
-        final = self.add_text_overlay(resized, message, position=None,
-                                    language_code=lang_code, brand_colors=brand_colors)
-
-        # Save with quality optimization
-        filename = f"{aspect_ratio.display_name}.jpg"
-        output_path = lang_dir / filename
-
-        final.save(output_path, quality=95, optimize=True)
-        lang_results[aspect_ratio.display_name] = (output_path, pre_overlay_path)
-
-        print(f"    ✓ {aspect_ratio.display_name}: {output_path}")
-
-      results[lang_code] = lang_results
+    # Pre-overlays are the same for every language, so they are written
+    # once to the product directory rather than into each language folder
+    output_dir.mkdir(parents=True, exist_ok=True)
+    pre_overlay_paths = self._queue_pre_overlays(base_variants, output_dir,
+                                                 io_pool, pending_writes)
+
+    # Render every (language, aspect ratio) pair concurrently
+    with self._share_base_variants(base_variants) as shared:
+      futures = {}
+      for lang_code, message in messages.items():
+        # Create language-specific subdirectory
+        lang_dir = output_dir / lang_code
+        lang_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info("Creating %s variations...", lang_code)
+
+        futures[lang_code] = {
+          name: self._submit_render(
+            executor, resized, pre_overlay_paths[name], message,
+            lang_dir, name, lang_code, brand_colors, io_pool, pending_writes,
+            shared=shared
+          )
+          for name, (resized, _) in base_variants.items()
+        }
+
+      for lang_code, lang_futures in futures.items():
+        results[lang_code] = {name: future.result() for name, future in lang_futures.items()}
+
+    # Surface any write errors before reporting success
+    for write in pending_writes:
+      write.result()
+
+    for lang_code, lang_results in results.items():
+      for name, (output_path, _) in lang_results.items():
+        logger.info("Saved %s/%s: %s", lang_code, name, output_path)
 
     return results
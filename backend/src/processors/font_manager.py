@@ -5,12 +5,57 @@ This module handles finding and loading appropriate fonts for different
 languages and scripts, including Arabic, Hebrew, CJK, and Latin scripts.
 """
 
+import os
 import platform
-from pathlib import Path
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
 from PIL import ImageFont
 
 
+@lru_cache(maxsize=32)
+def _font_dir_entries(dir_path: str) -> FrozenSet[str]:
+    """
+    List the file names in a font directory with a single scandir().
+
+    Names are normalized with os.path.normcase (case-insensitive on Windows).
+    Missing or unreadable directories have no entries.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            return frozenset(os.path.normcase(entry.name) for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+@lru_cache(maxsize=16)
+def _first_existing_font(candidates: Tuple[str, ...]) -> Optional[str]:
+    """
+    Return the first font path in candidates that exists on disk.
+
+    Cached by candidate list (which is fixed per platform and script), so the
+    lookups run once per process rather than on every overlay. Candidates
+    share a handful of font directories, each of which is listed once instead
+    of stat()-ing every candidate path.
+    """
+    for font in candidates:
+        dir_path, file_name = os.path.split(font)
+        if os.path.normcase(file_name) in _font_dir_entries(dir_path):
+            return font
+    return None
+
+
+@lru_cache(maxsize=64)
+def _load_truetype(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, reusing an already opened face for the same file and size.
+
+    Cached per process rather than per FontManager, so every composer (and
+    every language resolving to the same file) shares one parsed face.
+    Failed loads raise and are not cached.
+    """
+    return ImageFont.truetype(font_path, font_size)
+
+
 class FontManager:
     """
     Manages font discovery and loading for multi-language support.
@@ -42,14 +87,21 @@ class FontManager:
             default_font_path: Optional path to a default font file.
                              If not provided, searches system fonts.
         """
+        # Font paths found by find_font(), keyed by language_code
+        self._path_cache: Dict[Optional[str], Optional[str]] = {}
+
         self.default_font_path = default_font_path or self.find_font()
 
+        # Loaded fonts keyed by (size, language_code)
+        self._cache: Dict[Tuple[int, Optional[str]], ImageFont.FreeTypeFont] = {}
+
     def find_font(self, language_code: Optional[str] = None) -> Optional[str]:
         """
         Find a suitable font for text overlays with international script support.
 
         Searches platform-specific font directories, prioritizing fonts that support
         the requested language/script. Falls back to general Unicode fonts.
+        Results are cached per language code.
 
         Args:
             language_code: Optional ISO language code (e.g., 'ar', 'he', 'zh', 'ja', 'ko')
@@ -66,6 +118,9 @@ class FontManager:
             >>> font_mgr.find_font('zh')  # Chinese
             '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc'
         """
+        if language_code in self._path_cache:
+            return self._path_cache[language_code]
+
         system = platform.system()
 
         # Check if we need international script support
@@ -82,12 +137,10 @@ class FontManager:
         else:  # Linux / Docker
             font_candidates = self._get_linux_fonts(needs_arabic, needs_hebrew, needs_cjk)
 
-        # Find first font that exists
-        for font in font_candidates:
-            if Path(font).exists():
-                return font
-
-        return None  # Will use PIL default
+        # Find first font that exists (None will use PIL default)
+        font_path = _first_existing_font(tuple(font_candidates))
+        self._path_cache[language_code] = font_path
+        return font_path
 
     def _get_macos_fonts(self, needs_arabic: bool, needs_hebrew: bool,
                         needs_cjk: bool, language_code: Optional[str]) -> list[str]:
@@ -196,6 +249,9 @@ class FontManager:
         3. Generic font search
         4. PIL default font (last resort)
 
+        Fonts are cached per (size, language), so repeated requests reuse the
+        same font object instead of re-running the font search and FreeType load.
+
         Args:
             font_size: Font size in pixels
             language_code: Optional language code for language-specific fonts
@@ -208,19 +264,62 @@ class FontManager:
             >>> font = font_mgr.load_font_with_fallback(48, 'ar')
             >>> # Font automatically selected for Arabic text
         """
+        cache_key = (font_size, language_code)
+        font = self._cache.get(cache_key)
+        if font is None:
+            font = self._load_font(font_size, language_code)
+            self._cache[cache_key] = font
+        return font
+
+    def preload(
+        self,
+        language_codes: Iterable[Optional[str]],
+        font_sizes: Iterable[int]
+    ) -> None:
+        """
+        Load fonts into the cache ahead of their first use.
+
+        Args:
+            language_codes: Language codes to load fonts for (None for the default font)
+            font_sizes: Font sizes in pixels to load for each language
+
+        Examples:
+            >>> font_mgr = FontManager()
+            >>> font_mgr.preload(['en', 'ar', 'ja'], [72])
+        """
+        font_sizes = list(font_sizes)
+        for language_code in language_codes:
+            for font_size in font_sizes:
+                self.load_font_with_fallback(font_size, language_code)
+
+    def _load_font(
+        self,
+        font_size: int,
+        language_code: Optional[str] = None
+    ) -> ImageFont.FreeTypeFont:
+        """
+        Load a font through the fallback chain, bypassing the cache.
+
+        Args:
+            font_size: Font size in pixels
+            language_code: Optional language code for language-specific fonts
+
+        Returns:
+            Loaded PIL ImageFont object
+        """
         # Try language-specific font first
         if language_code:
             font_path = self.find_font(language_code)
             if font_path:
                 try:
-                    return ImageFont.truetype(font_path, font_size)
+                    return self._truetype(font_path, font_size)
                 except (OSError, IOError):
                     pass  # Try next option
 
         # Try default font path
         if self.default_font_path:
             try:
-                return ImageFont.truetype(self.default_font_path, font_size)
+                return self._truetype(self.default_font_path, font_size)
             except (OSError, IOError):
                 pass  # Try next option
 
@@ -228,9 +327,25 @@ class FontManager:
         font_path = self.find_font()
         if font_path:
             try:
-                return ImageFont.truetype(font_path, font_size)
+                return self._truetype(font_path, font_size)
             except (OSError, IOError):
                 pass  # Use default
 
         # Final fallback: PIL default font
         return ImageFont.load_default()
+
+    def _truetype(self, font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+        """
+        Load a TrueType font through the process-wide face cache.
+
+        Args:
+            font_path: Path to the font file
+            font_size: Font size in pixels
+
+        Returns:
+            Loaded PIL FreeTypeFont
+
+        Raises:
+            OSError: If the font file cannot be loaded
+        """
+        return _load_truetype(font_path, font_size)
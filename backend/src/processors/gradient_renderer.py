@@ -6,9 +6,16 @@ streaming services) that enhance text readability without completely obscuring
 the background image.
 """
 
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import numpy as np
 from PIL import Image
 
+# Number of rendered gradients kept for reuse
+GRADIENT_CACHE_SIZE = 16
+
 
 class GradientRenderer:
     """
@@ -48,6 +55,15 @@ class GradientRenderer:
         self.max_alpha = max_alpha
         self.fade_exponent = fade_exponent
 
+        # Rendered gradient masks keyed by (image_size, direction), in LRU order.
+        # Shared between the composer's render threads, hence the lock.
+        self._cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Fade alpha tables keyed by gradient length (see _fade_lut). Only a
+        # few lengths occur: the aspect ratio dimensions
+        self._fade_cache: Dict[int, np.ndarray] = {}
+
     def create_directional_gradient(
         self,
         image_size: Tuple[int, int],
@@ -90,14 +106,112 @@ class GradientRenderer:
             >>> img = Image.open('photo.jpg').convert('RGBA')
             >>> result = Image.alpha_composite(img, overlay)
         """
+        overlay = Image.new('RGBA', image_size, (*scrim_color, 0))
+        overlay.putalpha(self.create_directional_gradient_mask(image_size, text_position, text_size))
+        return overlay
+
+    def apply_directional_gradient(
+        self,
+        image: Image.Image,
+        text_position: Tuple[int, int],
+        text_size: Tuple[int, int],
+        scrim_color: Tuple[int, int, int]
+    ) -> None:
+        """
+        Blend a directional gradient scrim directly onto an image, in place.
+
+        Same result as alpha-compositing create_directional_gradient(), but
+        the solid scrim color is pasted through the cached opacity mask, and
+        only over the part of the mask that is non-zero (the fade reaches
+        zero well before the far edge). No RGBA overlay is allocated.
+
+        Args:
+            image: RGB PIL Image to draw on (modified in place)
+            text_position: Tuple of (x, y) coordinates of text top-left corner
+            text_size: Tuple of (width, height) of text bounding box
+            scrim_color: RGB tuple of the gradient color
+
+        Examples:
+            >>> renderer = GradientRenderer()
+            >>> img = Image.open('photo.jpg').convert('RGB')
+            >>> renderer.apply_directional_gradient(img, (200, 900), (600, 80), (0, 0, 0))
+        """
+        mask = self.create_directional_gradient_mask(image.size, text_position, text_size)
+        scrim_box = mask.getbbox()
+        if scrim_box:
+            image.paste(scrim_color, scrim_box, mask.crop(scrim_box))
+
+    def create_directional_gradient_mask(
+        self,
+        image_size: Tuple[int, int],
+        text_position: Tuple[int, int],
+        text_size: Tuple[int, int]
+    ) -> Image.Image:
+        """
+        Create the opacity mask of a directional gradient.
+
+        Same gradient as create_directional_gradient(), as a single 'L' channel.
+        Compositing a solid scrim color through this mask onto an RGB image
+        avoids building and flattening a full RGBA overlay.
+
+        The text only determines the fade direction, so masks are cached by
+        image size and direction; callers must not modify the result.
+
+        Args:
+            image_size: Tuple of (width, height) of the image in pixels
+            text_position: Tuple of (x, y) coordinates of text top-left corner
+            text_size: Tuple of (width, height) of text bounding box
+
+        Returns:
+            'L' mode PIL Image with the gradient opacity (0 = transparent)
+
+        Examples:
+            >>> renderer = GradientRenderer()
+            >>> mask = renderer.create_directional_gradient_mask(
+            ...     (1080, 1080), (200, 900), (600, 80)
+            ... )
+            >>> scrim = Image.new('RGB', (1080, 1080), (0, 0, 0))
+            >>> result = Image.composite(scrim, photo, mask)
+        """
+        direction = self._gradient_direction(image_size, text_position, text_size)
+        cache_key = (tuple(image_size), direction)
+
+        with self._cache_lock:
+            mask = self._cache.get(cache_key)
+            if mask is not None:
+                self._cache.move_to_end(cache_key)
+                return mask
+
+        mask = self._render_directional_gradient(image_size, direction)
+
+        with self._cache_lock:
+            self._cache[cache_key] = mask
+            while len(self._cache) > GRADIENT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return mask
+
+    def _gradient_direction(
+        self,
+        image_size: Tuple[int, int],
+        text_position: Tuple[int, int],
+        text_size: Tuple[int, int]
+    ) -> str:
+        """
+        Find the image edge closest to the text center.
+
+        Args:
+            image_size: Tuple of (width, height) of the image in pixels
+            text_position: Tuple of (x, y) coordinates of text top-left corner
+            text_size: Tuple of (width, height) of text bounding box
+
+        Returns:
+            One of "top", "bottom", "left", "right" (ties resolve in that order)
+        """
         img_width, img_height = image_size
         text_x, text_y = text_position
         text_width, text_height = text_size
 
-        # Create transparent overlay
-        overlay = Image.new('RGBA', image_size, (0, 0, 0, 0))
-        pixels = overlay.load()
-
         # Calculate text center for distance calculations
         text_center_y = text_y + text_height // 2
         text_center_x = text_x + text_width // 2
@@ -112,34 +226,76 @@ class GradientRenderer:
         min_distance = min(distance_to_top, distance_to_bottom,
                           distance_to_left, distance_to_right)
 
-        # Create gradient from that edge across the entire image dimension
-        for y in range(img_height):
-            for x in range(img_width):
-                # Calculate distance from the edge where text is positioned
-                if min_distance == distance_to_top:
-                    # Text at top - fade from top down
-                    distance_from_edge = y / img_height
-                elif min_distance == distance_to_bottom:
-                    # Text at bottom - fade from bottom up
-                    distance_from_edge = (img_height - y) / img_height
-                elif min_distance == distance_to_left:
-                    # Text at left - fade from left to right
-                    distance_from_edge = x / img_width
-                else:
-                    # Text at right - fade from right to left
-                    distance_from_edge = (img_width - x) / img_width
-
-                # Apply exponential ease-out curve for smooth, natural fade
-                # Strongest at text edge, fades into image
-                fade = (1.0 - distance_from_edge) ** self.fade_exponent
-
-                # Calculate alpha channel based on fade
-                alpha = int(fade * self.max_alpha)
-
-                if alpha > 0:
-                    pixels[x, y] = (*scrim_color, alpha)
+        if min_distance == distance_to_top:
+            return "top"
+        if min_distance == distance_to_bottom:
+            return "bottom"
+        if min_distance == distance_to_left:
+            return "left"
+        return "right"
 
-        return overlay
+    def _render_directional_gradient(
+        self,
+        image_size: Tuple[int, int],
+        direction: str
+    ) -> Image.Image:
+        """
+        Render a gradient mask that fades from one edge across the whole image.
+
+        Args:
+            image_size: Tuple of (width, height) of the image in pixels
+            direction: Edge the gradient emanates from ("top", "bottom", "left", "right")
+
+        Returns:
+            'L' mode PIL Image with the gradient opacity
+        """
+        img_width, img_height = image_size
+        vertical = direction in ("top", "bottom")
+        lut = self._fade_lut(img_height if vertical else img_width)
+
+        # The fade only varies along one axis: take one line of alphas and
+        # repeat it across the other axis instead of visiting every pixel
+        if direction in ("top", "left"):
+            # Text at top/left - fade from that edge down/right
+            alpha_line = lut[:-1]
+        else:
+            # Text at bottom/right - fade from that edge up/left
+            alpha_line = lut[:0:-1]
+
+        if vertical:
+            alpha = np.repeat(alpha_line[:, np.newaxis], img_width, axis=1)
+        else:
+            alpha = np.tile(alpha_line, (img_height, 1))
+
+        return Image.fromarray(alpha, 'L')
+
+    def _fade_lut(self, length: int) -> np.ndarray:
+        """
+        Get the fade alphas for a gradient spanning length pixels.
+
+        Entry k is the alpha at distance k / length from the text edge, for
+        k = 0..length, so both fade directions of a length are slices of one
+        table. Tables are computed once per length and shared by all masks.
+
+        Args:
+            length: Gradient length in pixels (image height or width)
+
+        Returns:
+            Read-only uint8 array of length + 1 alphas
+        """
+        lut = self._fade_cache.get(length)
+        if lut is None:
+            distance_from_edge = np.arange(length + 1, dtype=np.float64) / length
+
+            # Apply exponential ease-out curve for smooth, natural fade
+            # Strongest at text edge, fades into image
+            fade = (1.0 - distance_from_edge) ** self.fade_exponent
+
+            # Truncated like int(); fade never goes negative
+            lut = (fade * self.max_alpha).astype(np.uint8)
+            lut.setflags(write=False)
+            self._fade_cache[length] = lut
+        return lut
 
     def create_vignette(
         self,
@@ -168,8 +324,6 @@ class GradientRenderer:
             >>> result = Image.alpha_composite(img, vignette)
         """
         width, height = image_size
-        overlay = Image.new('RGBA', image_size, (0, 0, 0, 0))
-        pixels = overlay.load()
 
         # Center point
         center_x = width / 2
@@ -178,23 +332,25 @@ class GradientRenderer:
         # Maximum distance from center (corner)
         max_distance = ((center_x ** 2) + (center_y ** 2)) ** 0.5
 
-        for y in range(height):
-            for x in range(width):
-                # Calculate distance from center
-                dx = x - center_x
-                dy = y - center_y
-                distance = (dx ** 2 + dy ** 2) ** 0.5
+        # Squared offsets from the center are separable: one row of x terms
+        # and one column of y terms, summed by broadcasting
+        dx = np.arange(width, dtype=np.float64) - center_x
+        dy = np.arange(height, dtype=np.float64) - center_y
+        distance = np.sqrt((dx * dx)[np.newaxis, :] + (dy * dy)[:, np.newaxis])
 
-                # Normalize distance (0 at center, 1 at corners)
-                normalized_distance = distance / max_distance
+        # Normalize distance (0 at center, 1 at corners)
+        normalized_distance = distance / max_distance
 
-                # Apply exponential curve for smooth vignette
-                vignette_amount = normalized_distance ** 2
+        # Apply exponential curve for smooth vignette
+        vignette_amount = normalized_distance ** 2
 
-                # Calculate alpha
-                alpha = int(vignette_amount * strength * 255)
+        # Calculate alpha, truncated like int(); the amount never goes negative
+        alpha = (vignette_amount * strength * 255).astype(np.uint8)
 
-                if alpha > 0:
-                    pixels[x, y] = (*color, alpha)
+        # Fully transparent pixels stay (0, 0, 0, 0) rather than taking the color
+        overlay = np.zeros((height, width, 4), dtype=np.uint8)
+        visible = alpha > 0
+        overlay[visible, :3] = color
+        overlay[..., 3] = alpha
 
-        return overlay
+        return Image.fromarray(overlay, 'RGBA')
@@ -5,11 +5,20 @@ This module handles finding optimal text positions, wrapping text to fit within
 boundaries, and analyzing image regions for text placement.
 """
 
-from typing import Tuple, Dict
+import unicodedata
+from typing import Tuple, Dict, List, Optional
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-from ..utils.color_utils import relative_luminance
+from ..utils.color_utils import relative_luminance, relative_luminance_batch
 from ..utils.image_utils import ensure_rgb
 
+# Region statistics are measured on every Nth pixel and row, with N chosen so
+# the sampled image is about this many pixels on its longer side. Means,
+# variances and the dominant color of a region need far fewer samples than an
+# HD image holds
+ANALYSIS_SAMPLE_SIZE = 256
+
 
 class TextLayoutEngine:
     """
@@ -29,7 +38,23 @@ class TextLayoutEngine:
         >>> wrapped = engine.wrap_text(text, font, max_width=800, draw_context=draw)
     """
 
-    def find_best_text_region(self, image: Image.Image) -> Tuple[Image.Image, str]:
+    # Candidate text regions as (position_name, x1, y1, x2, y2), with the box
+    # given as fractions of the image width and height. Order matters: equal
+    # scores resolve to the earliest region
+    REGION_FRACTIONS = (
+        ("bottom-left", 0.0, 0.7, 0.4, 1.0),
+        ("bottom-right", 0.6, 0.7, 1.0, 1.0),
+        ("bottom-center", 0.3, 0.7, 0.7, 1.0),
+        ("top-left", 0.0, 0.0, 0.4, 0.3),
+        ("top-right", 0.6, 0.0, 1.0, 0.3),
+        ("center", 0.2, 0.4, 0.8, 0.6),
+    )
+
+    def find_best_text_region(
+        self,
+        image: Image.Image,
+        pixels: Optional[np.ndarray] = None
+    ) -> Tuple[Image.Image, str]:
         """
         Find the region in the image with best contrast potential for text.
 
@@ -42,6 +67,9 @@ class TextLayoutEngine:
 
         Args:
             image: Source image to analyze
+            pixels: Optional (H, W, 3) uint8 RGB array of the same image, for
+                   callers that already hold one. Otherwise the image is
+                   converted to an array once here.
 
         Returns:
             Tuple of (best_region_image, position_name) where position_name is one of:
@@ -53,55 +81,146 @@ class TextLayoutEngine:
             >>> print(f"Best position: {position}")
             Best position: bottom-center
         """
-        width, height = image.size
+        # Convert once; the array and the returned crop both come from it
+        image = ensure_rgb(image)
+        if pixels is None:
+            # Every candidate region is a zero-copy slice of this array
+            pixels = np.asarray(image)
 
-        # Define candidate regions to check
-        regions = {
-            "bottom-left": (0, int(height * 0.7), int(width * 0.4), height),
-            "bottom-right": (int(width * 0.6), int(height * 0.7), width, height),
-            "bottom-center": (int(width * 0.3), int(height * 0.7), int(width * 0.7), height),
-            "top-left": (0, 0, int(width * 0.4), int(height * 0.3)),
-            "top-right": (int(width * 0.6), 0, width, int(height * 0.3)),
-            "center": (int(width * 0.2), int(height * 0.4), int(width * 0.8), int(height * 0.6))
-        }
+        box, best_position = self._best_text_box(pixels)
+
+        # Crop only the winning region (already RGB)
+        return image.crop(box), best_position
+
+    def _best_text_box(self, pixels: np.ndarray) -> Tuple[Tuple[int, int, int, int], str]:
+        """
+        Find the best text region of an image held as an array.
+
+        Region statistics come from summed-area tables of a strided sample of
+        the array (see ANALYSIS_SAMPLE_SIZE): one pass over the sample, then
+        four lookups per region, so no region is cropped or read pixel by
+        pixel. Boxes are in full-resolution coordinates.
+
+        Args:
+            pixels: (H, W, 3) uint8 RGB array of the image
+
+        Returns:
+            Tuple of (box, position_name) where box is (x1, y1, x2, y2)
+        """
+        height, width = pixels.shape[:2]
+        step = self._sample_step(height, width)
+
+        # Scale the candidate regions to this image
+        boxes = [
+            (int(width * fx1), int(height * fy1), int(width * fx2), int(height * fy2))
+            for _, fx1, fy1, fx2, fy2 in self.REGION_FRACTIONS
+        ]
+
+        # Each region covers the sampled rows and columns inside its box
+        # (the multiples of step), i.e. [ceil(start / step), ceil(end / step))
+        x1, y1, x2, y2 = (-(-np.array(boxes) // step)).T
+
+        sums, square_sums = self._integral_images(pixels[::step, ::step])
+
+        def region_totals(table: np.ndarray) -> np.ndarray:
+            return table[y2, x2] - table[y1, x2] - table[y2, x1] + table[y1, x1]
+
+        counts = np.maximum((x2 - x1) * (y2 - y1), 1)[:, np.newaxis]
+        totals = region_totals(sums)
+        # Integer sums are exact, so this matches a direct mean and variance
+        means = totals / counts
+        channel_variances = (region_totals(square_sums) * counts - totals * totals) / (counts * counts)
 
-        best_region = None
-        best_position = "bottom-center"
-        best_score = 0
+        # Truncated to integers, like the colors scored elsewhere
+        avg_colors = means.astype(np.intp)
+        # Variance per channel, averaged (lower = more uniform = better for text)
+        variances = channel_variances.mean(axis=1)
 
-        for position, (x1, y1, x2, y2) in regions.items():
-            region = image.crop((x1, y1, x2, y2))
-            region = ensure_rgb(region)
+        # Score all candidates at once; argmax keeps the first of equal scores
+        best = int(np.argmax(self._region_scores(avg_colors, variances)))
 
-            # Calculate uniformity and luminance
-            pixels = list(region.getdata())
-            avg_r = sum(p[0] for p in pixels) / len(pixels)
-            avg_g = sum(p[1] for p in pixels) / len(pixels)
-            avg_b = sum(p[2] for p in pixels) / len(pixels)
-            avg_color = (int(avg_r), int(avg_g), int(avg_b))
+        return boxes[best], self.REGION_FRACTIONS[best][0]
 
-            # Calculate variance to measure uniformity (lower variance = more uniform = better for text)
-            variance_r = sum((p[0] - avg_r) ** 2 for p in pixels) / len(pixels)
-            variance_g = sum((p[1] - avg_g) ** 2 for p in pixels) / len(pixels)
-            variance_b = sum((p[2] - avg_b) ** 2 for p in pixels) / len(pixels)
-            total_variance = (variance_r + variance_g + variance_b) / 3
+    @staticmethod
+    def _integral_images(pixels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build summed-area tables of pixel values and squared pixel values.
+
+        Args:
+            pixels: (H, W, 3) uint8 RGB array
+
+        Returns:
+            Tuple of two (H + 1, W + 1, 3) int64 arrays whose [y, x] entries
+            hold the per-channel sum of pixels[:y, :x] (and of their squares)
+        """
+        height, width = pixels.shape[:2]
+
+        sums = np.zeros((height + 1, width + 1, 3), dtype=np.int64)
+        np.cumsum(pixels, axis=0, dtype=np.int64, out=sums[1:, 1:])
+        np.cumsum(sums[1:, 1:], axis=1, out=sums[1:, 1:])
+
+        squares = pixels.astype(np.int64)
+        squares *= squares
+        square_sums = np.zeros_like(sums)
+        np.cumsum(squares, axis=0, out=square_sums[1:, 1:])
+        np.cumsum(square_sums[1:, 1:], axis=1, out=square_sums[1:, 1:])
+
+        return sums, square_sums
+
+    def sample_pixels(self, image: Image.Image) -> np.ndarray:
+        """
+        Get the pixel sample region statistics are measured on, as an array.
+
+        Takes every Nth pixel and row (see ANALYSIS_SAMPLE_SIZE) with a
+        nearest-neighbour resize, which reads only the sampled pixels, so the
+        full-resolution image is never copied into an array.
+
+        Args:
+            image: Source image to analyze
+
+        Returns:
+            (h, w, 3) uint8 RGB array of the sampled image
+        """
+        width, height = image.size
+        step = self._sample_step(height, width)
+        if step > 1:
+            image = image.resize((max(1, width // step), max(1, height // step)),
+                                 Image.Resampling.NEAREST)
+        return np.asarray(ensure_rgb(image))
+
+    @staticmethod
+    def _sample_step(height: int, width: int) -> int:
+        """Return the pixel stride that samples an image at ANALYSIS_SAMPLE_SIZE."""
+        return max(1, max(height, width) // ANALYSIS_SAMPLE_SIZE)
+
+    def _region_scores(self, avg_colors: np.ndarray, variances: np.ndarray) -> np.ndarray:
+        """
+        Score candidate text regions (higher is better).
 
-            # Score: prefer uniform regions (lower variance) that aren't mid-tone
-            luminance = relative_luminance(avg_color)
-            # Prefer very light or very dark regions (good natural contrast)
-            contrast_potential = abs(luminance - 0.5) * 2  # 0 to 1, higher is better
-            uniformity_score = 1.0 / (1.0 + total_variance / 10000)  # Normalize variance
+        Luminance comes from the shared sRGB lookup table for all regions in
+        one vectorized call, with no per-region gamma math.
 
-            score = contrast_potential * 0.7 + uniformity_score * 0.3
+        Args:
+            avg_colors: (N, 3) integer array of average RGB colors per region
+            variances: N per-channel pixel variances, averaged over channels
 
-            if score > best_score:
-                best_score = score
-                best_region = region
-                best_position = position
+        Returns:
+            N weighted scores of contrast potential (70%) and uniformity (30%)
+        """
+        # Score: prefer uniform regions (lower variance) that aren't mid-tone
+        luminance = relative_luminance_batch(avg_colors)
+        # Prefer very light or very dark regions (good natural contrast)
+        contrast_potential = np.abs(luminance - 0.5) * 2  # 0 to 1, higher is better
+        uniformity_score = 1.0 / (1.0 + variances / 10000)  # Normalize variance
 
-        return best_region, best_position
+        return contrast_potential * 0.7 + uniformity_score * 0.3
 
-    def analyze_text_region(self, image: Image.Image, position: str = None) -> Dict:
+    def analyze_text_region(
+        self,
+        image: Image.Image,
+        position: str = None,
+        pixels: Optional[np.ndarray] = None
+    ) -> Dict:
         """
         Analyze an image region to determine optimal text styling.
 
@@ -112,11 +231,17 @@ class TextLayoutEngine:
             image: Source image to analyze
             position: Optional position hint ("top", "bottom", "center").
                      If None, automatically finds best region.
+            pixels: Optional (H, W, 3) uint8 RGB array of the same image,
+                   full-resolution (np.asarray(image)) or sampled
+                   (sample_pixels(image)), for callers that already hold one.
+                   Otherwise the image is sampled here.
 
         Returns:
             Dictionary containing:
                 - average_color: RGB tuple of average region color
-                - luminance: Relative luminance (0.0-1.0)
+                - dominant_color: RGB tuple of the most common region color
+                  (5-bit quantized), the background the text is judged against
+                - luminance: Relative luminance of dominant_color (0.0-1.0)
                 - is_light: Boolean indicating if region is light
                 - position: Position name used
 
@@ -126,42 +251,69 @@ class TextLayoutEngine:
             >>> if analysis["is_light"]:
             ...     print("Use dark text on this light background")
         """
+        if pixels is None:
+            pixels = self.sample_pixels(image)
+
+        # Regions are located in the array's own coordinates, so a sampled
+        # array (see sample_pixels) works as well as a full-resolution one
+        height, width = pixels.shape[:2]
         if position:
             # Extract the specified region
-            width, height = image.size
             if position == "bottom":
-                text_region = image.crop((0, int(height * 0.7), width, height))
+                box = (0, int(height * 0.7), width, height)
                 region_position = "bottom"
             elif position == "top":
-                text_region = image.crop((0, 0, width, int(height * 0.3)))
+                box = (0, 0, width, int(height * 0.3))
                 region_position = "top"
             else:  # center or other
-                text_region = image.crop((int(width * 0.2), int(height * 0.4),
-                                         int(width * 0.8), int(height * 0.6)))
+                box = (int(width * 0.2), int(height * 0.4),
+                       int(width * 0.8), int(height * 0.6))
                 region_position = "center"
         else:
-            # Smart positioning: analyze multiple regions and pick the best
-            text_region, region_position = self.find_best_text_region(image)
-
-        # Convert to RGB if needed
-        text_region = ensure_rgb(text_region)
-
-        # Get dominant colors in that region
-        pixels = list(text_region.getdata())
-        avg_r = sum(p[0] for p in pixels) / len(pixels)
-        avg_g = sum(p[1] for p in pixels) / len(pixels)
-        avg_b = sum(p[2] for p in pixels) / len(pixels)
-
-        avg_color = (int(avg_r), int(avg_g), int(avg_b))
-        avg_luminance = relative_luminance(avg_color)
+            # Smart positioning: analyze multiple regions and pick the best,
+            # then read the winner straight from the array (no crop)
+            box, region_position = self._best_text_box(pixels)
+
+        x1, y1, x2, y2 = box
+        step = self._sample_step(*pixels.shape[:2])
+        region_pixels = pixels[y1:y2:step, x1:x2:step]
+
+        # Get dominant colors in that region. The mode, unlike the mean, is a
+        # color actually behind the text in two-tone regions (sky + building)
+        region_pixels = region_pixels.reshape(-1, 3)
+        avg = region_pixels.mean(axis=0)
+        avg_color = (int(avg[0]), int(avg[1]), int(avg[2]))
+        dominant_color = self._dominant_color(region_pixels)
+        dominant_luminance = relative_luminance(dominant_color)
 
         return {
             "average_color": avg_color,
-            "luminance": avg_luminance,
-            "is_light": avg_luminance > 0.5,
+            "dominant_color": dominant_color,
+            "luminance": dominant_luminance,
+            "is_light": dominant_luminance > 0.5,
             "position": region_position
         }
 
+    def _dominant_color(self, region_pixels: np.ndarray) -> Tuple[int, int, int]:
+        """
+        Find the most common color of a region, quantized to 5 bits per channel.
+
+        One bincount over packed 15-bit color indices (32768 bins), so the
+        cost is a single linear pass with no per-pixel Python.
+
+        Args:
+            region_pixels: (N, 3) uint8 RGB array
+
+        Returns:
+            RGB tuple at the center of the most populated color bin
+        """
+        quantized = (region_pixels >> 3).astype(np.uint16)
+        index = (quantized[:, 0] << 10) | (quantized[:, 1] << 5) | quantized[:, 2]
+        top = int(np.bincount(index, minlength=1 << 15).argmax())
+
+        # Bin center: at most 4 off per channel from any color in the bin
+        return (((top >> 10) & 31) << 3 | 4, ((top >> 5) & 31) << 3 | 4, (top & 31) << 3 | 4)
+
     def wrap_text(
         self,
         text: str,
@@ -201,32 +353,106 @@ class TextLayoutEngine:
 
         Note:
             If a single word is longer than max_width, it will be placed on its own
-            line to avoid infinite loops, even though it exceeds the width.
+            line to avoid infinite loops, even though it exceeds the width. Runs of
+            CJK characters (written without spaces) are broken between characters
+            instead.
         """
         words = text.split()
-        lines = []
-        current_line = []
 
-        for word in words:
-            # Try adding this word to current line
-            test_line = ' '.join(current_line + [word])
-            bbox = draw_context.textbbox((0, 0), test_line, font=font)
-            line_width = bbox[2] - bbox[0]
+        # Most headlines fit on one line: one measurement instead of one per word
+        single_line = ' '.join(words)
+        bbox = draw_context.textbbox((0, 0), single_line, font=font)
+        if bbox[2] - bbox[0] <= max_width:
+            return single_line
+
+        def fits(line_words: List[str]) -> bool:
+            bbox = draw_context.textbbox((0, 0), ' '.join(line_words), font=font)
+            return bbox[2] - bbox[0] <= max_width
+
+        # Each word's advance width is measured once, so line breaks can be
+        # estimated by adding widths. A line's measured (ink) width differs
+        # from its summed advances only by kerning and side bearings, far
+        # less than an em; breaks the estimate puts closer than that to
+        # max_width are confirmed (and moved if needed) by measuring the
+        # actual line, as growing each line one measured word at a time did
+        space_width = font.getlength(' ')
+        widths = [font.getlength(word) for word in words]
+        margin = getattr(font, 'size', max_width)
 
-            if line_width <= max_width:
-                current_line.append(word)
-            else:
-                # Line is too long, start new line
-                if current_line:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Single word is too long, add it anyway to avoid infinite loop
-                    lines.append(word)
-                    current_line = []
-
-        # Add remaining words
-        if current_line:
-            lines.append(' '.join(current_line))
+        lines = []
+        start = 0
+        while start < len(words):
+            # Estimate how many words fit on this line
+            end = start + 1
+            estimate = widths[start]
+            while end < len(words) and estimate + space_width + widths[end] <= max_width:
+                estimate += space_width + widths[end]
+                end += 1
+
+            # Confirm a close estimate: add words while they still fit...
+            grew = False
+            while (end < len(words)
+                   and estimate + space_width + widths[end] <= max_width + margin
+                   and fits(words[start:end + 1])):
+                estimate += space_width + widths[end]
+                end += 1
+                grew = True
+            # ...or drop words until the line fits
+            if not grew and estimate > max_width - margin:
+                while end - start > 1 and not fits(words[start:end]):
+                    end -= 1
+
+            word = words[start]
+            if end - start == 1 and self._breaks_anywhere(word) and not fits([word]):
+                # CJK text has no spaces to wrap at; break between characters
+                # and carry on with the rest of the word
+                *full_lines, rest = self._break_word(word, font, max_width)
+                if full_lines:
+                    lines.extend(full_lines)
+                    words[start] = rest
+                    widths[start] = font.getlength(rest)
+                    continue
+
+            # A single word too long for any line still gets a line of its own
+            lines.append(' '.join(words[start:end]))
+            start = end
 
         return '\n'.join(lines)
+
+    @staticmethod
+    def _breaks_anywhere(word: str) -> bool:
+        """
+        Check whether a word may be broken between any two characters.
+
+        True for words containing wide (CJK) characters, whose scripts are
+        written without spaces between words.
+        """
+        return any(unicodedata.east_asian_width(ch) in ('W', 'F') for ch in word)
+
+    @staticmethod
+    def _break_word(word: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
+        """
+        Break a word into pieces no wider than max_width, between characters.
+
+        Widths are glyph advances from font.getlength(), which FreeType
+        serves from its glyph cache. A single character wider than max_width
+        still gets a piece of its own.
+
+        Args:
+            word: Word to break (non-empty)
+            font: Font to use for measurement
+            max_width: Maximum width in pixels
+
+        Returns:
+            Non-empty list of pieces, in order
+        """
+        pieces = []
+        piece = word[0]
+        for ch in word[1:]:
+            if font.getlength(piece + ch) <= max_width:
+                piece += ch
+            else:
+                pieces.append(piece)
+                piece = ch
+        pieces.append(piece)
+        return pieces
@@ -0,0 +1,189 @@
+"""
+Redis-backed storage for campaign status and progress updates.
+
+Campaign records live in Redis so the API process and the queue workers
+share a single view of every campaign, and state survives restarts.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# Campaign metadata expires after this long without updates (default: 7 days)
+CAMPAIGN_TTL_SECONDS = int(os.getenv("CAMPAIGN_TTL_SECONDS", str(7 * 24 * 3600)))
+
+
+def campaign_key(campaign_id: str) -> str:
+  """Redis hash key holding a campaign record."""
+  return f"campaign:{campaign_id}"
+
+
+def progress_key(campaign_id: str) -> str:
+  """Redis list key holding a campaign's progress updates."""
+  return f"campaign_progress:{campaign_id}"
+
+
+def queue_progress(pipe: Any, campaign_id: str, progress_data: Dict[str, Any], ttl_seconds: int) -> None:
+  """
+  Queue the writes for one progress update on a Redis pipeline.
+
+  Shared by the async store and the synchronous ProgressRecorder; pipeline
+  commands are buffered without awaiting, so the same calls work for both.
+  """
+  encoded = json.dumps(progress_data)
+  pipe.rpush(progress_key(campaign_id), encoded)
+  pipe.hset(campaign_key(campaign_id), "latest_progress", encoded)
+  pipe.expire(progress_key(campaign_id), ttl_seconds)
+  pipe.expire(campaign_key(campaign_id), ttl_seconds)
+
+
+def encode_fields(fields: Dict[str, Any]) -> Dict[str, str]:
+  """JSON-encode each value so nested data survives a Redis hash round trip."""
+  return {name: json.dumps(value) for name, value in fields.items()}
+
+
+def decode_fields(raw: Dict[str, str]) -> Dict[str, Any]:
+  """Inverse of encode_fields."""
+  return {name: json.loads(value) for name, value in raw.items()}
+
+
+class CampaignStore:
+  """
+  Stores campaign records as Redis hashes and progress as Redis lists.
+
+  Every write refreshes a TTL on the campaign's keys, so finished campaigns
+  are evicted automatically once they go stale. Timestamps (created_at,
+  started_at, completed_at) are stored as Unix epoch seconds.
+  """
+
+  def __init__(self, redis_url: Optional[str] = None, ttl_seconds: int = CAMPAIGN_TTL_SECONDS):
+    """
+    Initialize the campaign store.
+
+    Args:
+      redis_url: Redis connection URL (if not provided, reads REDIS_URL from env)
+      ttl_seconds: Expiry applied to campaign keys on every write
+    """
+    self.redis = Redis.from_url(redis_url or REDIS_URL, decode_responses=True)
+    self.ttl_seconds = ttl_seconds
+
+  async def close(self) -> None:
+    """Close the underlying Redis connection pool."""
+    await self.redis.aclose()
+
+  async def create(self, campaign_id: str, record: Dict[str, Any]) -> None:
+    """
+    Store a new campaign record.
+
+    Args:
+      campaign_id: Campaign identifier
+      record: Initial campaign fields
+    """
+    await self._write(campaign_id, record)
+
+  async def update(self, campaign_id: str, **fields: Any) -> None:
+    """Set one or more fields on an existing campaign record."""
+    await self._write(campaign_id, fields)
+
+  async def _write(self, campaign_id: str, fields: Dict[str, Any]) -> None:
+    """Write fields to the campaign hash and refresh its TTL in one round trip."""
+    key = campaign_key(campaign_id)
+    async with self.redis.pipeline(transaction=True) as pipe:
+      pipe.hset(key, mapping=encode_fields(fields))
+      pipe.expire(key, self.ttl_seconds)
+      await pipe.execute()
+
+  async def get(self, campaign_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a campaign record.
+
+    Returns:
+      Campaign fields, or None if the campaign does not exist
+    """
+    raw = await self.redis.hgetall(campaign_key(campaign_id))
+    return decode_fields(raw) if raw else None
+
+  async def get_many(self, campaign_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch several campaign records in a single round trip.
+
+    Returns:
+      Mapping of campaign id to fields, omitting campaigns that no longer exist
+    """
+    async with self.redis.pipeline(transaction=False) as pipe:
+      for campaign_id in campaign_ids:
+        pipe.hgetall(campaign_key(campaign_id))
+      raws = await pipe.execute()
+
+    return {
+      campaign_id: decode_fields(raw)
+      for campaign_id, raw in zip(campaign_ids, raws)
+      if raw
+    }
+
+  async def list_ids(self) -> List[str]:
+    """
+    Get the ids of all known campaigns.
+
+    Uses SCAN rather than a separate index so expired campaigns drop out
+    of the listing on their own.
+    """
+    prefix = campaign_key("")
+    return sorted([
+      key[len(prefix):]
+      async for key in self.redis.scan_iter(match=f"{prefix}*", count=500)
+    ])
+
+  async def append_progress(self, campaign_id: str, progress_data: Dict[str, Any]) -> None:
+    """
+    Record a progress update from the pipeline.
+
+    Appends to the campaign's progress history and also stores it as the
+    latest progress on the campaign record for quick status polling.
+    """
+    async with self.redis.pipeline(transaction=True) as pipe:
+      queue_progress(pipe, campaign_id, progress_data, self.ttl_seconds)
+      await pipe.execute()
+
+  async def get_progress(self, campaign_id: str) -> List[Dict[str, Any]]:
+    """Get all progress updates for a campaign in chronological order."""
+    return [json.loads(item) for item in await self.redis.lrange(progress_key(campaign_id), 0, -1)]
+
+
+class ProgressRecorder:
+  """
+  Synchronous progress callback for pipelines running outside the event loop.
+
+  Worker subprocesses have no asyncio loop to hand updates back to, so they
+  write progress to Redis directly with a blocking client.
+  """
+
+  def __init__(self, campaign_id: str, redis_url: Optional[str] = None,
+               ttl_seconds: int = CAMPAIGN_TTL_SECONDS):
+    """
+    Initialize the progress recorder.
+
+    Args:
+      campaign_id: Campaign the updates belong to
+      redis_url: Redis connection URL (if not provided, reads REDIS_URL from env)
+      ttl_seconds: Expiry applied to campaign keys on every write
+    """
+    self.campaign_id = campaign_id
+    self.redis = SyncRedis.from_url(redis_url or REDIS_URL, decode_responses=True)
+    self.ttl_seconds = ttl_seconds
+
+  def __call__(self, progress_data: Dict[str, Any]) -> None:
+    """Record a progress update from the pipeline."""
+    with self.redis.pipeline(transaction=True) as pipe:
+      queue_progress(pipe, self.campaign_id, progress_data, self.ttl_seconds)
+      pipe.execute()
+
+  def close(self) -> None:
+    """Close the underlying Redis connection pool."""
+    self.redis.close()
@@ -2,6 +2,7 @@
 AI-powered creative copywriting service using GPT-4.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from openai import OpenAI
 import os
@@ -42,6 +43,94 @@ class CreativeCopywriter:
     }
   }
 
+  # Prompt templates, filled with str.format_map(); literal braces are doubled.
+  # Built once per process instead of as f-strings on every request
+  PERSONA_PROMPT = """
+    Analyze this target audience for marketing messaging:
+    Audience: {target_audience}
+
+    Provide a concise JSON response with:
+    {{
+      "demographics": "age range and lifestyle",
+      "values": ["list", "of", "core", "values"],
+      "pain_points": ["main", "challenges"],
+      "emotional_triggers": ["positive", "emotions", "to", "evoke"],
+      "avoid_terms": ["terms", "to", "avoid"]
+    }}
+    """
+
+  MESSAGE_PROMPT = """
+    Create 3 optimized marketing messages for a social media campaign.
+
+    CONTEXT:
+    - Original message: "{base_message}"
+    - Products: {products}
+    - Target audience: {target_audience}
+    - Region: {target_region}
+    - Cultural style: {cultural_style}
+    - Audience values: {audience_values}
+
+    REQUIREMENTS:
+    - Maximum {max_length} words per message
+    - Match the cultural communication style for {target_region}
+    - Appeal to the emotional triggers: {emotional_triggers}
+    - Avoid: {avoid_terms}
+    - Focus on benefits, not features
+    - Be authentic and engaging
+
+    Provide exactly 3 messages in this JSON format:
+    {{
+      "messages": [
+        {{
+          "text": "message here",
+          "reasoning": "why this works for the audience",
+          "emotional_hook": "the emotion targeted",
+          "confidence": 0.95
+        }}
+      ]
+    }}
+
+    Order by effectiveness (best first).
+    """
+
+  AB_TEST_PROMPT = """
+    Create {count} A/B test variants of this message, each using a different approach:
+
+    Original: "{base_message}"
+    Audience: {audience}
+    Region: {region}
+
+    Use these approaches: {approaches}
+
+    Provide JSON with {count} variants:
+    {{
+      "variants": [
+        {{
+          "text": "message",
+          "approach": "approach used",
+          "hypothesis": "why this might work better"
+        }}
+      ]
+    }}
+
+    Keep each under 10 words.
+    """
+
+  LOCALIZATION_PROMPT = """
+    Translate this marketing message to these languages, maintaining marketing effectiveness:
+
+    Message: "{message}"
+    Languages: {languages}
+
+    Provide culturally-adapted translations (not literal):
+    {{
+      "translations": {{
+        "language_code": "translated message"
+      }},
+      "notes": "any cultural adaptations made"
+    }}
+    """
+
   def __init__(self, api_key: Optional[str] = None):
     """
     Initialize the creative copywriter.
@@ -57,29 +146,29 @@ class CreativeCopywriter:
     self.client = OpenAI(api_key=self.api_key)
     self.model = "gpt-4o-mini"  # Fast and cost-effective
 
+    # (target_audience, model) -> persona insights. Briefs re-run for A/B
+    # tests or other regions share an audience, so its analysis is reused
+    self._persona_cache: Dict[tuple, Dict] = {}
+
   def analyze_audience_persona(self, target_audience: str) -> Dict:
     """
     Extract key persona attributes for message tailoring.
 
+    Successful analyses are cached per audience and model; failed ones are
+    retried on the next call.
+
     Args:
       target_audience: Description of target audience
 
     Returns:
-      Dictionary with persona insights
+      Dictionary with persona insights (shared between calls; do not modify)
     """
-    prompt = f"""
-    Analyze this target audience for marketing messaging:
-    Audience: {target_audience}
+    cache_key = (target_audience, self.model)
+    persona = self._persona_cache.get(cache_key)
+    if persona is not None:
+      return persona
 
-    Provide a concise JSON response with:
-    {{
-      "demographics": "age range and lifestyle",
-      "values": ["list", "of", "core", "values"],
-      "pain_points": ["main", "challenges"],
-      "emotional_triggers": ["positive", "emotions", "to", "evoke"],
-      "avoid_terms": ["terms", "to", "avoid"]
-    }}
-    """
+    prompt = self.PERSONA_PROMPT.format_map({"target_audience": target_audience})
 
     try:
       response = self.client.chat.completions.create(
@@ -95,7 +184,9 @@ class CreativeCopywriter:
       # Parse JSON response
       content = response.choices[0].message.content
       # Clean up markdown if present and parse JSON
-      return parse_json_response(content)
+      persona = parse_json_response(content)
+      self._persona_cache[cache_key] = persona
+      return persona
 
     except Exception as e:
       print(f"Warning: Persona analysis failed: {e}")
@@ -137,39 +228,17 @@ class CreativeCopywriter:
     )
 
     # Build comprehensive prompt
-    prompt = f"""
-    Create 3 optimized marketing messages for a social media campaign.
-
-    CONTEXT:
-    - Original message: "{base_message}"
-    - Products: {', '.join([f"{p.name} ({p.description})" for p in products])}
-    - Target audience: {target_audience}
-    - Region: {target_region}
-    - Cultural style: {regional_context['style']}
-    - Audience values: {', '.join(persona.get('values', []))}
-
-    REQUIREMENTS:
-    - Maximum {max_length} words per message
-    - Match the cultural communication style for {target_region}
-    - Appeal to the emotional triggers: {', '.join(persona.get('emotional_triggers', []))}
-    - Avoid: {', '.join(persona.get('avoid_terms', []))}
-    - Focus on benefits, not features
-    - Be authentic and engaging
-
-    Provide exactly 3 messages in this JSON format:
-    {{
-      "messages": [
-        {{
-          "text": "message here",
-          "reasoning": "why this works for the audience",
-          "emotional_hook": "the emotion targeted",
-          "confidence": 0.95
-        }}
-      ]
-    }}
-
-    Order by effectiveness (best first).
-    """
+    prompt = self.MESSAGE_PROMPT.format_map({
+      "base_message": base_message,
+      "products": ', '.join([f"{p.name} ({p.description})" for p in products]),
+      "target_audience": target_audience,
+      "target_region": target_region,
+      "cultural_style": regional_context['style'],
+      "audience_values": ', '.join(persona.get('values', [])),
+      "max_length": max_length,
+      "emotional_triggers": ', '.join(persona.get('emotional_triggers', [])),
+      "avoid_terms": ', '.join(persona.get('avoid_terms', []))
+    })
 
     try:
       response = self.client.chat.completions.create(
@@ -234,28 +303,13 @@ class CreativeCopywriter:
       "problem-solving (fix their pain)"
     ]
 
-    prompt = f"""
-    Create {count} A/B test variants of this message, each using a different approach:
-
-    Original: "{base_message}"
-    Audience: {audience}
-    Region: {region}
-
-    Use these approaches: {', '.join(approaches[:count])}
-
-    Provide JSON with {count} variants:
-    {{
-      "variants": [
-        {{
-          "text": "message",
-          "approach": "approach used",
-          "hypothesis": "why this might work better"
-        }}
-      ]
-    }}
-
-    Keep each under 10 words.
-    """
+    prompt = self.AB_TEST_PROMPT.format_map({
+      "count": count,
+      "base_message": base_message,
+      "audience": audience,
+      "region": region,
+      "approaches": ', '.join(approaches[:count])
+    })
 
     try:
       response = self.client.chat.completions.create(
@@ -312,20 +366,10 @@ class CreativeCopywriter:
       "ar-AE": "Arabic"
     }
 
-    prompt = f"""
-    Translate this marketing message to these languages, maintaining marketing effectiveness:
-
-    Message: "{message}"
-    Languages: {', '.join([language_names.get(lang, lang) for lang in languages])}
-
-    Provide culturally-adapted translations (not literal):
-    {{
-      "translations": {{
-        "language_code": "translated message"
-      }},
-      "notes": "any cultural adaptations made"
-    }}
-    """
+    prompt = self.LOCALIZATION_PROMPT.format_map({
+      "message": message,
+      "languages": ', '.join([language_names.get(lang, lang) for lang in languages])
+    })
 
     try:
       response = self.client.chat.completions.create(
@@ -360,27 +404,34 @@ class CreativeCopywriter:
     Returns:
       Comprehensive copywriting results
     """
-    # Generate optimized messages
-    optimized = self.generate_optimized_message(
-      base_message=brief.campaign_message,
-      target_audience=brief.target_audience,
-      target_region=brief.target_region,
-      products=brief.products
-    )
+    # The requests are network-bound. A/B variants only depend on the
+    # brief, so they are generated in the background while this thread
+    # optimizes the message and then localizes it
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="copywriter") as pool:
+      # Generate A/B test variants
+      ab_future = pool.submit(
+        self.generate_ab_test_variants,
+        base_message=brief.campaign_message,
+        audience=brief.target_audience,
+        region=brief.target_region,
+        count=3
+      )
 
-    # Generate A/B test variants
-    ab_variants = self.generate_ab_test_variants(
-      base_message=brief.campaign_message,
-      audience=brief.target_audience,
-      region=brief.target_region,
-      count=3
-    )
+      # Generate optimized messages
+      optimized = self.generate_optimized_message(
+        base_message=brief.campaign_message,
+        target_audience=brief.target_audience,
+        target_region=brief.target_region,
+        products=brief.products
+      )
 
-    # Suggest localizations
-    localizations = self.suggest_localizations(
-      message=optimized["primary_message"],
-      region=brief.target_region
-    )
+      # Suggest localizations (needs the optimized message)
+      localizations = self.suggest_localizations(
+        message=optimized["primary_message"],
+        region=brief.target_region
+      )
+
+      ab_variants = ab_future.result()
 
     return {
       "optimization": optimized,
@@ -0,0 +1,96 @@
+"""
+Static file serving with an in-memory cache for small files.
+
+Thumbnails and source previews are requested over and over by the gallery
+views. Holding the bytes of small files in memory turns a repeat request
+into a dict lookup instead of an open() + read() per hit.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import aiofiles
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Files larger than this are streamed from disk as usual (256 KiB)
+MAX_CACHED_FILE_SIZE = 256 * 1024
+
+# Maximum number of files held in memory
+MAX_CACHED_FILES = 256
+
+
+class CachedStaticFiles(StaticFiles):
+  """
+  StaticFiles that serves small files from a bounded LRU cache.
+
+  Entries are keyed by path and invalidated when the file's mtime changes,
+  so regenerated assets are picked up on the next request. Conditional
+  requests (ETag / Last-Modified) are still answered by StaticFiles before
+  the cache is consulted.
+  """
+
+  def __init__(self, *args, max_file_size: int = MAX_CACHED_FILE_SIZE,
+               max_entries: int = MAX_CACHED_FILES, **kwargs):
+    """
+    Initialize the static file app.
+
+    Args:
+      max_file_size: Largest file (in bytes) that will be cached
+      max_entries: Maximum number of files kept in the cache
+      *args, **kwargs: Passed through to StaticFiles
+    """
+    super().__init__(*args, **kwargs)
+    self.max_file_size = max_file_size
+    self.max_entries = max_entries
+    self._cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+
+  async def get_response(self, path: str, scope: Scope) -> Response:
+    """Serve the file, from memory when it is small enough to cache."""
+    response = await super().get_response(path, scope)
+
+    # Only full GET file responses are cacheable; HEAD, 304s and errors pass through
+    if (scope["method"] != "GET" or not isinstance(response, FileResponse)
+        or response.status_code != 200):
+      return response
+
+    stat_result = response.stat_result
+    if stat_result is None or stat_result.st_size > self.max_file_size:
+      return response
+
+    content = await self.cached_file(str(response.path), stat_result)
+
+    # Ranges are not supported on in-memory responses
+    headers: Dict[str, str] = {
+      name: value for name, value in response.headers.items()
+      if name != "accept-ranges"
+    }
+    return Response(content=content, headers=headers)
+
+  async def cached_file(self, path: str, stat_result: os.stat_result) -> bytes:
+    """
+    Get a file's bytes, reading from disk only on a miss or when it changed.
+
+    Args:
+      path: Absolute path of the file
+      stat_result: Stat result already obtained during the path lookup
+
+    Returns:
+      File contents
+    """
+    entry = self._cache.get(path)
+    if entry is not None and entry[0] == stat_result.st_mtime_ns:
+      self._cache.move_to_end(path)
+      return entry[1]
+
+    async with aiofiles.open(path, "rb") as f:
+      content = await f.read()
+
+    self._cache[path] = (stat_result.st_mtime_ns, content)
+    self._cache.move_to_end(path)
+    while len(self._cache) > self.max_entries:
+      self._cache.popitem(last=False)
+
+    return content
@@ -2,7 +2,8 @@
 Utility modules for common operations across the application.
 
 This package consolidates frequently-used functions for color manipulation,
-string processing, image handling, AI response parsing, and path operations.
+string processing, image handling, AI response parsing, path operations and
+logging setup.
 """
 
 from .color_utils import (
@@ -13,6 +14,8 @@ from .color_utils import (
     color_distance,
     relative_luminance,
     calculate_contrast_ratio,
+    relative_luminance_batch,
+    contrast_ratio_matrix,
 )
 
 from .string_utils import (
@@ -25,6 +28,8 @@ from .image_utils import (
     ensure_rgb,
     validate_image_dimensions,
     get_aspect_ratio,
+    blend_rgba_array,
+    encode_jpeg,
 )
 
 from .ai_utils import (
@@ -38,6 +43,13 @@ from .path_utils import (
     ensure_dir,
     resolve_campaign_path,
     get_campaign_output_dir,
+    atomic_write_bytes,
+)
+
+from .log_utils import (
+    start_queue_logging,
+    install_queue_handler,
+    get_log_queue,
 )
 
 __all__ = [
@@ -49,6 +61,8 @@ __all__ = [
     'color_distance',
     'relative_luminance',
     'calculate_contrast_ratio',
+    'relative_luminance_batch',
+    'contrast_ratio_matrix',
     # String utilities
     'to_safe_filename',
     'sanitize_filename',
@@ -57,6 +71,8 @@ __all__ = [
     'ensure_rgb',
     'validate_image_dimensions',
     'get_aspect_ratio',
+    'blend_rgba_array',
+    'encode_jpeg',
     # AI utilities
     'extract_json_from_markdown',
     'parse_json_response',
@@ -66,4 +82,9 @@ __all__ = [
     'ensure_dir',
     'resolve_campaign_path',
     'get_campaign_output_dir',
+    'atomic_write_bytes',
+    # Logging utilities
+    'start_queue_logging',
+    'install_queue_handler',
+    'get_log_queue',
 ]
@@ -0,0 +1,171 @@
+"""
+Compiled WCAG luminance and contrast kernels for 8-bit RGB data.
+
+When Numba is installed these functions are JIT-compiled on first use (and
+cached on disk), so they can be called from other compiled kernels such as
+per-pixel region analysis. Without Numba, equivalent NumPy implementations
+are used. Both produce the same values as relative_luminance() and
+calculate_contrast_ratio() in color_utils.
+"""
+
+import numpy as np
+
+from .color_utils import _SRGB_TO_LINEAR_ARRAY
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Optional dependency
+    NUMBA_AVAILABLE = False
+
+
+# sRGB -> linear light lookup table, frozen into compiled kernels as a constant
+_LINEAR = _SRGB_TO_LINEAR_ARRAY
+
+
+def _luminance_u8(r: int, g: int, b: int) -> float:
+    """
+    Calculate WCAG relative luminance of one 8-bit RGB color.
+
+    Args:
+        r: Red value (0-255)
+        g: Green value (0-255)
+        b: Blue value (0-255)
+
+    Returns:
+        Relative luminance value (0.0-1.0)
+    """
+    return 0.2126 * _LINEAR[r] + 0.7152 * _LINEAR[g] + 0.0722 * _LINEAR[b]
+
+
+def _contrast_u8(rgb_a: np.ndarray, rgb_b: np.ndarray) -> float:
+    """
+    Calculate the WCAG contrast ratio between two 8-bit RGB colors.
+
+    Args:
+        rgb_a: Array of 3 uint8 values
+        rgb_b: Array of 3 uint8 values
+
+    Returns:
+        Contrast ratio (1.0-21.0)
+    """
+    l1 = luminance_u8(rgb_a[0], rgb_a[1], rgb_a[2])
+    l2 = luminance_u8(rgb_b[0], rgb_b[1], rgb_b[2])
+    return (max(l1, l2) + 0.05) / (min(l1, l2) + 0.05)
+
+
+def _contrast_batch_u8(colors_a: np.ndarray, colors_b: np.ndarray) -> np.ndarray:
+    """Compiled contrast_batch_u8: plain loops, inlined by Numba."""
+    n = colors_a.shape[0]
+    m = colors_b.shape[0]
+
+    lum_b = np.empty(m)
+    for j in range(m):
+        lum_b[j] = luminance_u8(colors_b[j, 0], colors_b[j, 1], colors_b[j, 2])
+
+    ratios = np.empty((n, m))
+    for i in range(n):
+        lum_a = luminance_u8(colors_a[i, 0], colors_a[i, 1], colors_a[i, 2])
+        for j in range(m):
+            lighter = max(lum_a, lum_b[j])
+            darker = min(lum_a, lum_b[j])
+            ratios[i, j] = (lighter + 0.05) / (darker + 0.05)
+    return ratios
+
+
+def _contrast_batch_u8_numpy(colors_a: np.ndarray, colors_b: np.ndarray) -> np.ndarray:
+    """NumPy contrast_batch_u8, used when Numba is not installed."""
+    def luminance(colors):
+        linear = _LINEAR[colors.astype(np.intp)]
+        return 0.2126 * linear[:, 0] + 0.7152 * linear[:, 1] + 0.0722 * linear[:, 2]
+
+    a = luminance(colors_a)[:, np.newaxis]
+    b = luminance(colors_b)[np.newaxis, :]
+    return (np.maximum(a, b) + 0.05) / (np.minimum(a, b) + 0.05)
+
+
+def _best_contrast_u8(candidates: np.ndarray, background: np.ndarray,
+                      min_ratio: float) -> tuple:
+    """Compiled best_contrast_u8: one pass, keeping the first of equal ratios."""
+    lum_bg = luminance_u8(background[0], background[1], background[2])
+
+    best_idx = -1
+    best_ratio = 0.0
+    for i in range(candidates.shape[0]):
+        lum = luminance_u8(candidates[i, 0], candidates[i, 1], candidates[i, 2])
+        ratio = (max(lum, lum_bg) + 0.05) / (min(lum, lum_bg) + 0.05)
+        if ratio >= min_ratio and ratio > best_ratio:
+            best_idx = i
+            best_ratio = ratio
+    return best_idx, best_ratio
+
+
+def _best_contrast_u8_numpy(candidates: np.ndarray, background: np.ndarray,
+                            min_ratio: float) -> tuple:
+    """NumPy best_contrast_u8, used when Numba is not installed."""
+    ratios = _contrast_batch_u8_numpy(candidates, background.reshape(1, 3))[:, 0]
+    valid = ratios >= min_ratio
+    if not valid.any():
+        return -1, 0.0
+    # argmax returns the first of equal ratios, matching candidate order
+    best_idx = int(np.argmax(np.where(valid, ratios, -1.0)))
+    return best_idx, float(ratios[best_idx])
+
+
+if NUMBA_AVAILABLE:
+    luminance_u8 = njit(cache=True)(_luminance_u8)
+    contrast_u8 = njit(cache=True)(_contrast_u8)
+    _contrast_batch_kernel = njit(cache=True)(_contrast_batch_u8)
+    _best_contrast_kernel = njit(cache=True)(_best_contrast_u8)
+else:
+    luminance_u8 = _luminance_u8
+    contrast_u8 = _contrast_u8
+    _contrast_batch_kernel = _contrast_batch_u8_numpy
+    _best_contrast_kernel = _best_contrast_u8_numpy
+
+
+def contrast_batch_u8(colors_a, colors_b) -> np.ndarray:
+    """
+    Calculate WCAG contrast ratios between every pair of two color lists.
+
+    Args:
+        colors_a: N RGB colors as an (N, 3) array or sequence of tuples (0-255)
+        colors_b: M RGB colors as an (M, 3) array or sequence of tuples (0-255)
+
+    Returns:
+        (N, M) array where [i, j] is the contrast ratio of colors_a[i]
+        against colors_b[j]
+
+    Examples:
+        >>> contrast_batch_u8([(0, 0, 0)], [(255, 255, 255), (0, 0, 0)])
+        array([[21.,  1.]])
+    """
+    a = np.asarray(colors_a, dtype=np.uint8).reshape(-1, 3)
+    b = np.asarray(colors_b, dtype=np.uint8).reshape(-1, 3)
+    return _contrast_batch_kernel(a, b)
+
+
+def best_contrast_u8(candidates, background, min_ratio: float) -> tuple:
+    """
+    Find the candidate color with the highest contrast against a background.
+
+    Only candidates reaching min_ratio qualify; of equal ratios the first
+    candidate wins.
+
+    Args:
+        candidates: N RGB colors as an (N, 3) array or sequence of tuples (0-255)
+        background: RGB background color (0-255)
+        min_ratio: Minimum contrast ratio a candidate must reach
+
+    Returns:
+        Tuple of (index, contrast_ratio), or (-1, 0.0) if no candidate
+        reaches min_ratio
+
+    Examples:
+        >>> best_contrast_u8([(255, 255, 0), (0, 0, 128)], (255, 255, 255), 7.0)
+        (1, 16.0...)
+    """
+    a = np.asarray(candidates, dtype=np.uint8).reshape(-1, 3)
+    b = np.asarray(background, dtype=np.uint8).reshape(3)
+    best_idx, best_ratio = _best_contrast_kernel(a, b, float(min_ratio))
+    return int(best_idx), float(best_ratio)
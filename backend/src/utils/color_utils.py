@@ -6,13 +6,32 @@ providing a single source of truth for color conversions, distance calculations,
 contrast checking, and color naming.
 """
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Sequence, Tuple
 
+import numpy as np
 
+
+# WCAG luminance weights for linear R, G, B
+_LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+# sRGB -> linear light for every 8-bit channel value, per the WCAG 2.0 formula.
+# Only 256 inputs exist, so luminance becomes table lookups instead of pow().
+_SRGB_TO_LINEAR = tuple(
+    c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (i / 255.0 for i in range(256))
+)
+_SRGB_TO_LINEAR_ARRAY = np.array(_SRGB_TO_LINEAR)
+
+
+@lru_cache(maxsize=256)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """
     Convert hex color code to RGB tuple.
 
+    Results are cached, since the same brand palette is parsed for every
+    creative in a campaign.
+
     Args:
         hex_color: Hex color code (with or without '#' prefix)
                   Examples: "#FF0000", "00FF00"
@@ -257,7 +276,7 @@ def relative_luminance(rgb: Tuple[int, int, int]) -> float:
     The calculation applies gamma correction to match human perception.
 
     Args:
-        rgb: RGB color tuple (0-255, 0-255, 0-255)
+        rgb: RGB color tuple of integers (0-255, 0-255, 0-255)
 
     Returns:
         Relative luminance value (0.0-1.0)
@@ -272,16 +291,11 @@ def relative_luminance(rgb: Tuple[int, int, int]) -> float:
         >>> relative_luminance((255, 255, 255))  # White
         1.0
     """
-    # Normalize to 0-1 range
-    r, g, b = [c/255.0 for c in rgb]
-
-    # Apply gamma correction per WCAG spec
-    r = r/12.92 if r <= 0.03928 else ((r + 0.055)/1.055) ** 2.4
-    g = g/12.92 if g <= 0.03928 else ((g + 0.055)/1.055) ** 2.4
-    b = b/12.92 if b <= 0.03928 else ((b + 0.055)/1.055) ** 2.4
-
-    # WCAG luminance formula (weighted for human perception)
-    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+    # Gamma correction per WCAG spec, precomputed per channel value
+    r, g, b = rgb
+    return (0.2126 * _SRGB_TO_LINEAR[r] +
+            0.7152 * _SRGB_TO_LINEAR[g] +
+            0.0722 * _SRGB_TO_LINEAR[b])
 
 
 def calculate_contrast_ratio(color1: Tuple[int, int, int],
@@ -309,6 +323,17 @@ def calculate_contrast_ratio(color1: Tuple[int, int, int],
     References:
         WCAG 2.0: https://www.w3.org/TR/WCAG20/#contrast-ratiodef
     """
+    # The ratio is symmetric, so order the pair to share one cache entry
+    color1, color2 = tuple(color1), tuple(color2)
+    if color2 < color1:
+        color1, color2 = color2, color1
+    return _contrast_ratio_cached(color1, color2)
+
+
+@lru_cache(maxsize=4096)
+def _contrast_ratio_cached(color1: Tuple[int, int, int],
+                           color2: Tuple[int, int, int]) -> float:
+    """Contrast ratio for an ordered color pair (see calculate_contrast_ratio)."""
     # Convert to relative luminance
     l1 = relative_luminance(color1)
     l2 = relative_luminance(color2)
@@ -318,3 +343,49 @@ def calculate_contrast_ratio(color1: Tuple[int, int, int],
     darker = min(l1, l2)
 
     return (lighter + 0.05) / (darker + 0.05)
+
+
+def relative_luminance_batch(rgb_colors: Sequence[Tuple[int, int, int]]) -> np.ndarray:
+    """
+    Calculate WCAG relative luminance for many colors at once.
+
+    Vectorized equivalent of relative_luminance(), for callers that compare
+    whole palettes and would otherwise loop over colors in Python.
+
+    Args:
+        rgb_colors: Sequence (or (N, 3) array) of integer RGB colors (0-255)
+
+    Returns:
+        Array of N relative luminance values (0.0-1.0)
+
+    Examples:
+        >>> relative_luminance_batch([(0, 0, 0), (255, 255, 255)])
+        array([0., 1.])
+    """
+    channels = np.asarray(rgb_colors, dtype=np.intp).reshape(-1, 3)
+
+    # Gamma correction per WCAG spec, via the same per-channel table
+    return _SRGB_TO_LINEAR_ARRAY[channels] @ _LUMINANCE_WEIGHTS
+
+
+def contrast_ratio_matrix(luminances_a: Sequence[float],
+                          luminances_b: Sequence[float]) -> np.ndarray:
+    """
+    Calculate WCAG contrast ratios between every pair of two luminance lists.
+
+    Args:
+        luminances_a: N relative luminance values (e.g., text colors)
+        luminances_b: M relative luminance values (e.g., backgrounds)
+
+    Returns:
+        (N, M) array where [i, j] is the contrast ratio of a[i] against b[j]
+
+    Examples:
+        >>> contrast_ratio_matrix([0.0], [1.0, 0.0])
+        array([[21.,  1.]])
+    """
+    a = np.asarray(luminances_a, dtype=np.float64)[:, np.newaxis]
+    b = np.asarray(luminances_b, dtype=np.float64)[np.newaxis, :]
+
+    # WCAG contrast formula
+    return (np.maximum(a, b) + 0.05) / (np.minimum(a, b) + 0.05)
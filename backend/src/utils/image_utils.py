@@ -5,9 +5,39 @@ This module provides common PIL/Pillow image operations used throughout
 the application, ensuring consistency in image handling.
 """
 
-from PIL import Image
+import io
 from typing import Tuple
 
+import PIL
+from PIL import Image
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420, TJFLAG_PROGRESSIVE
+except ImportError:  # Optional accelerator; Pillow's encoder is used instead
+    TurboJPEG = None
+
+# JPEG quality used for all generated creatives. Social platforms re-encode
+# uploads anyway; above ~90 files grow quickly for no visible gain
+JPEG_QUALITY = 90
+
+# Pillow-SIMD versions carry a ".postN" suffix (e.g. "9.5.0.post1"); stock
+# Pillow does not. Same API either way, only resize/composite are faster
+PILLOW_SIMD = ".post" in PIL.__version__
+
+_turbojpeg = None
+
+
+def _get_turbojpeg():
+    """Return a shared TurboJPEG encoder, or None if it is unavailable."""
+    global _turbojpeg, TurboJPEG
+    if _turbojpeg is None and TurboJPEG is not None:
+        try:
+            _turbojpeg = TurboJPEG()
+        except (OSError, RuntimeError):
+            # Python bindings installed without the native library
+            TurboJPEG = None
+    return _turbojpeg
+
 
 def ensure_rgb(image: Image.Image) -> Image.Image:
     """
@@ -104,3 +134,88 @@ def get_aspect_ratio(image: Image.Image) -> Tuple[int, int]:
     divisor = gcd(width, height)
 
     return (width // divisor, height // divisor)
+
+
+def blend_rgba_array(image: Image.Image, overlay, position: Tuple[int, int]) -> None:
+    """
+    Alpha-blend an RGBA pixel array onto an RGB image in place.
+
+    Vectorized alternative to per-pixel getpixel()/putpixel() loops for
+    custom effects computed with NumPy: only the covered region is converted
+    to an array, blended in integer math and pasted back. Parts of the
+    overlay outside the image are ignored.
+
+    Args:
+        image: RGB PIL Image to draw on
+        overlay: uint8 array of shape (height, width, 4) with straight alpha
+        position: Tuple of (x, y) of the overlay's top-left corner
+
+    Examples:
+        >>> import numpy as np
+        >>> from PIL import Image
+        >>> img = Image.new('RGB', (100, 100), (255, 255, 255))
+        >>> shade = np.zeros((20, 100, 4), dtype=np.uint8)
+        >>> shade[..., 3] = 128  # 50% black band
+        >>> blend_rgba_array(img, shade, (0, 80))
+        >>> img.getpixel((0, 90))
+        (127, 127, 127)
+    """
+    import numpy as np
+
+    x, y = position
+    height, width = overlay.shape[:2]
+
+    # Clip the overlay to the image bounds
+    left, top = max(x, 0), max(y, 0)
+    right, bottom = min(x + width, image.width), min(y + height, image.height)
+    if left >= right or top >= bottom:
+        return
+    overlay = overlay[top - y:bottom - y, left - x:right - x]
+
+    background = np.asarray(image.crop((left, top, right, bottom)), dtype=np.uint16)
+    color = overlay[..., :3].astype(np.uint16)
+    alpha = overlay[..., 3:4].astype(np.uint16)
+
+    # Rounded integer blend, matching Pillow's own compositing
+    blended = (color * alpha + background * (255 - alpha) + 127) // 255
+    image.paste(Image.fromarray(blended.astype(np.uint8), 'RGB'), (left, top))
+
+
+def encode_jpeg(image: Image.Image, quality: int = JPEG_QUALITY,
+                progressive: bool = False) -> bytes:
+    """
+    Encode an image as a 4:2:0 JPEG, baseline unless progressive is set.
+
+    Uses libjpeg-turbo directly through PyTurboJPEG when it is installed,
+    otherwise Pillow. The extra Huffman optimization pass (optimize=True) is
+    skipped: it only trims a few percent off the file size but roughly
+    doubles encode time. Progressive files are smaller still (~15-20%) but
+    take about three times as long to encode as baseline ones.
+
+    Args:
+        image: PIL Image object (converted to RGB if needed)
+        quality: JPEG quality (1-95)
+        progressive: Encode a progressive instead of a baseline JPEG
+
+    Returns:
+        Encoded JPEG bytes
+
+    Examples:
+        >>> from PIL import Image
+        >>> data = encode_jpeg(Image.new('RGB', (100, 100)))
+        >>> data[:2]
+        b'\\xff\\xd8'
+    """
+    image = ensure_rgb(image)
+
+    encoder = _get_turbojpeg()
+    if encoder is not None:
+        import numpy as np
+        return encoder.encode(np.asarray(image), quality=quality,
+                              pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420,
+                              flags=TJFLAG_PROGRESSIVE if progressive else 0)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality, optimize=False,
+               progressive=progressive, subsampling=2)
+    return buffer.getvalue()
@@ -0,0 +1,81 @@
+"""
+Logging utility functions for multi-threaded and multi-process pipelines.
+
+Log records are handed to a queue and written by a single background
+listener thread, so render threads and pool processes never block on (or
+interleave output through) shared file and console handlers.
+"""
+
+import atexit
+import logging
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+# Queue feeding the active listener (None until logging is set up). Created
+# from the spawn context so it can be handed to spawned pool processes.
+_log_queue: Optional["multiprocessing.Queue"] = None
+
+
+def start_queue_logging(handlers: List[logging.Handler],
+                        level: int = logging.INFO) -> QueueListener:
+    """
+    Route all logging through a queue to handlers on a background thread.
+
+    Replaces the root logger's handlers with a single QueueHandler and starts
+    a QueueListener that passes records on to handlers. The listener is
+    stopped (flushing queued records) at interpreter exit.
+
+    Args:
+        handlers: Handlers that do the actual writing (file, console, ...)
+        level: Root logger level
+
+    Returns:
+        The started QueueListener
+
+    Examples:
+        >>> listener = start_queue_logging([logging.StreamHandler()])
+        >>> logging.getLogger(__name__).info("Written by the listener thread")
+    """
+    global _log_queue
+    _log_queue = multiprocessing.get_context("spawn").Queue()
+
+    listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    install_queue_handler(_log_queue, level)
+    return listener
+
+
+def install_queue_handler(log_queue: "multiprocessing.Queue",
+                          level: int = logging.INFO) -> None:
+    """
+    Send this process's log records to a queue started by start_queue_logging.
+
+    Meant as a process pool initializer, so pool processes log through the
+    parent's listener: initializer=install_queue_handler,
+    initargs=(get_log_queue(), level).
+
+    Args:
+        log_queue: Queue returned by get_log_queue() in the parent process
+        level: Root logger level
+    """
+    global _log_queue
+    _log_queue = log_queue
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+
+def get_log_queue() -> Optional["multiprocessing.Queue"]:
+    """
+    Get the queue this process logs through.
+
+    Returns:
+        The logging queue, or None if queue logging is not set up
+    """
+    return _log_queue
@@ -5,6 +5,7 @@ This module provides common path operations used throughout the application,
 particularly for campaign directory management and file organization.
 """
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -58,7 +59,7 @@ def resolve_campaign_path(base_path: Path, campaign_id: str) -> Optional[Path]:
     """
     # Check for nested structure first
     nested_path = base_path / campaign_id / campaign_id
-    if nested_path.exists() and nested_path.is_dir():
+    if nested_path.is_dir():
         return nested_path
 
     # Fall back to flat structure
@@ -92,3 +93,22 @@ def get_campaign_output_dir(
         PosixPath('./my_output/campaign_456')
     """
     return Path(base_dir) / campaign_id
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file so readers never observe a partially written file.
+
+    Data is written to a hidden temporary file in the same directory, then
+    renamed over the destination (an atomic replace on POSIX and Windows).
+
+    Args:
+        path: Destination file path
+        data: File contents
+
+    Examples:
+        >>> atomic_write_bytes(Path('./output/1x1.jpg'), jpeg_bytes)
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,145 @@
+"""
+ARQ worker for Creative Automation Pipeline campaign processing.
+
+Campaigns queued by the API are picked up here and processed outside the
+web server process. Run with:
+
+  arq worker.WorkerSettings
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any
+
+from arq.connections import RedisSettings
+from dotenv import load_dotenv
+
+from src.models.campaign import CampaignBrief
+from src.pipeline.orchestrator import CampaignPipeline
+from src.services.campaign_store import CampaignStore, ProgressRecorder, REDIS_URL
+from src.utils.log_utils import start_queue_logging, install_queue_handler, get_log_queue
+from src.utils.path_utils import resolve_campaign_path
+
+# Load environment variables
+load_dotenv()
+
+# Output directory for generated assets (shared with the API)
+OUTPUT_DIR = Path("./output")
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Number of pipeline processes per worker (default: one per CPU)
+PIPELINE_PROCESSES = int(os.getenv("PIPELINE_PROCESSES", str(os.cpu_count() or 1)))
+
+
+def run_pipeline(campaign_id: str, brief_data: Dict[str, Any],
+                 enable_copywriting: bool, output_dir: str) -> Dict[str, Any]:
+  """
+  Run the campaign pipeline to completion (executes in a pool process).
+
+  Args:
+    campaign_id: Campaign identifier, used to tag progress updates
+    brief_data: Campaign brief as produced by CampaignBrief.to_dict()
+    enable_copywriting: Enable AI copywriting optimization
+    output_dir: Base directory for the campaign's output files
+
+  Returns:
+    Campaign report from the pipeline
+  """
+  progress_recorder = ProgressRecorder(campaign_id)
+  try:
+    pipeline = CampaignPipeline(
+      output_dir=output_dir,
+      enable_copywriting=enable_copywriting,
+      progress_callback=progress_recorder
+    )
+    return pipeline.process_campaign(CampaignBrief.from_dict(brief_data))
+  finally:
+    progress_recorder.close()
+
+
+async def process_campaign_task(ctx: Dict[str, Any], campaign_id: str,
+                                brief_data: Dict[str, Any], enable_copywriting: bool):
+  """Queue job to process a campaign."""
+  store: CampaignStore = ctx["store"]
+  loop = asyncio.get_running_loop()
+
+  try:
+    # Update status
+    await store.update(
+      campaign_id,
+      status="processing",
+      started_at=time.time()
+    )
+
+    # Process campaign in a pool process so image work never holds the
+    # worker's GIL and the worker keeps heartbeating
+    output_path = OUTPUT_DIR / campaign_id
+    report = await loop.run_in_executor(
+      ctx["pipeline_pool"], run_pipeline,
+      campaign_id, brief_data, enable_copywriting, str(output_path)
+    )
+
+    # Resolve the (possibly nested) product directory once, so the API
+    # can list assets without probing the filesystem on every request
+    resolved_output_path = resolve_campaign_path(OUTPUT_DIR, campaign_id) or output_path
+
+    # Update status with results
+    await store.update(
+      campaign_id,
+      status="completed",
+      completed_at=time.time(),
+      report=report,
+      output_path=str(output_path),
+      resolved_output_path=str(resolved_output_path)
+    )
+
+  except Exception as e:
+    # Update status with error
+    await store.update(
+      campaign_id,
+      status="failed",
+      error=str(e),
+      completed_at=time.time()
+    )
+
+
+async def startup(ctx: Dict[str, Any]):
+  """Open the campaign store and pipeline process pool when the worker starts."""
+  ctx["store"] = CampaignStore()
+
+  # Pipeline processes log through one queue, written by a listener thread
+  # here, so their output does not interleave on the console
+  handler = logging.StreamHandler()
+  handler.setFormatter(logging.Formatter('%(asctime)s - %(processName)s - %(levelname)s - %(message)s'))
+  start_queue_logging([handler])
+
+  # Spawn rather than fork: the worker process already has an event loop
+  # and open Redis connections that must not be inherited
+  ctx["pipeline_pool"] = ProcessPoolExecutor(
+    max_workers=PIPELINE_PROCESSES,
+    mp_context=multiprocessing.get_context("spawn"),
+    initializer=install_queue_handler,
+    initargs=(get_log_queue(), logging.INFO)
+  )
+
+
+async def shutdown(ctx: Dict[str, Any]):
+  """Close the campaign store and pipeline process pool when the worker stops."""
+  ctx["pipeline_pool"].shutdown(wait=True, cancel_futures=True)
+  await ctx["store"].close()
+
+
+class WorkerSettings:
+  """ARQ worker configuration."""
+
+  functions = [process_campaign_task]
+  on_startup = startup
+  on_shutdown = shutdown
+  redis_settings = RedisSettings.from_dsn(REDIS_URL)
+  # Campaigns make several DALL-E/GPT round trips and can take minutes
+  job_timeout = 1800